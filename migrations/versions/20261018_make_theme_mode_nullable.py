@@ -0,0 +1,43 @@
+"""make user_settings.theme_mode nullable
+
+Revision ID: cf384c982a44
+Revises: 7a8b9c0d1e2f
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cf384c982a44"
+down_revision: Union[str, None] = "7a8b9c0d1e2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    with op.batch_alter_table("user_settings", schema=None) as batch_op:
+        batch_op.alter_column(
+            "theme_mode",
+            existing_type=sa.String(length=10),
+            nullable=True,
+        )
+
+    # Until now theme_mode was never written, so 'system' is the column
+    # default rather than a user choice; NULL now means "not chosen"
+    op.execute("UPDATE user_settings SET theme_mode = NULL WHERE theme_mode = 'system'")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("UPDATE user_settings SET theme_mode = 'system' WHERE theme_mode IS NULL")
+
+    with op.batch_alter_table("user_settings", schema=None) as batch_op:
+        batch_op.alter_column(
+            "theme_mode",
+            existing_type=sa.String(length=10),
+            nullable=False,
+        )
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 import flet as ft
 
@@ -13,7 +14,8 @@ from src.services.fetch_queue_service import FetchPriority, FetchQueueService
 from src.services.gmail_service import GmailService
 from src.services.newsletter_service import NewsletterService
 from src.services.scheduler_service import SchedulerService
-from src.ui.themes import AppTheme, BorderRadius, Colors, Spacing, Typography
+from src.ui.components import Sidebar
+from src.ui.themes import AppTheme, BorderRadius, Colors, Spacing, Typography, get_colors
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)
 class NewsletterApp:
     """Main application orchestrator."""
 
+    # How long the cached newsletter list stays fresh
+    CACHE_TTL_SECONDS = 60.0
+
     def __init__(self, page: ft.Page):
         """Initialize the application.
 
@@ -40,6 +45,25 @@ class NewsletterApp:
         # Session maker
         self._session_maker = None
 
+        # Shared sidebar (reused across page navigations)
+        self._sidebar: Optional[Sidebar] = None
+        self._sidebar_colors = None
+
+        # Cached settings view (reused while the colors are unchanged)
+        self._settings_page = None
+
+        # Static configuration error view, built on first use
+        self._config_error_view: Optional[ft.View] = None
+
+        # Pending coalesced page.update() (see batch_update)
+        self._update_scheduled = False
+
+        # Signed-in user's email, kept for the whole sign-in session
+        self.cached_user_email: Optional[str] = None
+
+        # Cached newsletter list as (value, monotonic timestamp)
+        self._newsletters_cache: Optional[tuple[list, float]] = None
+
     async def initialize(self) -> None:
         """Initialize the application."""
         # Configure page
@@ -111,6 +135,17 @@ class NewsletterApp:
                 settings_repo = UserSettingsRepository(session)
                 user_settings = await settings_repo.get_settings()
 
+                # Restore the saved appearance mode before the first paint
+                saved_mode: Optional[ft.ThemeMode] = None
+                if user_settings.theme_mode:
+                    try:
+                        saved_mode = ft.ThemeMode(user_settings.theme_mode)
+                    except ValueError:
+                        logger.warning(
+                            f"Ignoring unknown theme mode '{user_settings.theme_mode}'"
+                        )
+                self.page.theme_mode = saved_mode or ft.ThemeMode.SYSTEM
+
                 theme_filename = user_settings.active_theme or "default.json"
 
                 # Skip if using default (already applied in initialize())
@@ -132,11 +167,12 @@ class NewsletterApp:
                 # Apply theme to global color cache
                 light_colors, dark_colors = theme_service.apply_theme(theme)
 
-                # Set theme mode based on theme's base preference
-                if theme.metadata.base == "dark":
-                    self.page.theme_mode = ft.ThemeMode.DARK
-                else:
-                    self.page.theme_mode = ft.ThemeMode.LIGHT
+                # Without a saved appearance mode, follow the theme's base
+                if saved_mode is None:
+                    if theme.metadata.base == "dark":
+                        self.page.theme_mode = ft.ThemeMode.DARK
+                    else:
+                        self.page.theme_mode = ft.ThemeMode.LIGHT
 
                 # Update Flet page theme objects with custom colors
                 self.page.theme = AppTheme.create_theme_from_colors(light_colors)
@@ -174,7 +210,11 @@ class NewsletterApp:
                 session=session,
                 gmail_service=self.gmail_service,
             )
-            return await newsletter_service.fetch_newsletter_emails(newsletter_id)
+            fetched = await newsletter_service.fetch_newsletter_emails(newsletter_id)
+        if fetched:
+            # Unread counts changed
+            self.invalidate_newsletters_cache()
+        return fetched
 
     async def _check_auth_and_navigate(self) -> None:
         """Check authentication status and navigate appropriately."""
@@ -191,6 +231,7 @@ class NewsletterApp:
             if auth_result.success:
                 # Initialize Gmail service
                 self.gmail_service = GmailService(auth_result.credentials)
+                self.page.run_task(self.warm_settings_cache)
                 self.page.go("/home")
             else:
                 self.page.go("/login")
@@ -209,11 +250,10 @@ class NewsletterApp:
         from src.ui.pages.home_page import HomePage
         from src.ui.pages.login_page import LoginPage
         from src.ui.pages.newsletters_page import NewslettersPage
-        from src.ui.pages.settings_page import SettingsPage
 
         # Route to appropriate page
         if self.page.route == "/config-error":
-            self.page.views.append(self._create_config_error_view())
+            self.page.views.append(self.get_config_error_view())
         elif self.page.route == "/login":
             self.page.views.append(LoginPage(self))
         elif self.page.route == "/home":
@@ -227,7 +267,7 @@ class NewsletterApp:
             email_id = int(self.page.route.split("/")[-1])
             self.page.views.append(EmailReaderPage(self, email_id))
         elif self.page.route == "/settings":
-            self.page.views.append(SettingsPage(self))
+            self.page.views.append(self.get_settings_page())
         else:
             # Default to home or config error
             async with self._session_maker() as session:
@@ -235,7 +275,7 @@ class NewsletterApp:
                 if await auth_service.is_app_configured():
                     self.page.views.append(HomePage(self))
                 else:
-                    self.page.views.append(self._create_config_error_view())
+                    self.page.views.append(self.get_config_error_view())
 
         self.page.update()
 
@@ -250,6 +290,18 @@ class NewsletterApp:
         if top_view:
             self.page.go(top_view.route)
 
+    def get_config_error_view(self) -> ft.View:
+        """Get the configuration error view, building it on first use.
+
+        The view is static, so repeat visits reuse the same control tree.
+
+        Returns:
+            View showing configuration error message.
+        """
+        if self._config_error_view is None:
+            self._config_error_view = self._create_config_error_view()
+        return self._config_error_view
+
     def _create_config_error_view(self) -> ft.View:
         """Create an error view for missing OAuth configuration.
 
@@ -342,11 +394,144 @@ class NewsletterApp:
     def get_session(self):
         """Get an async session for database operations.
 
+        Sessions are cheap units of work over the process-wide pooled engine
+        (see src.models.base), so callers open one per operation instead of
+        sharing a long-lived session, which is not safe for concurrent use.
+
         Returns:
             Async session context manager.
         """
         return self._session_maker()
 
+    def get_sidebar(self, current_route: str, on_navigate: Callable[[str], None]) -> Sidebar:
+        """Get the shared sidebar, pointed at the given route.
+
+        The sidebar is built once and reused across navigations, keeping its
+        newsletter list between pages. It is only rebuilt when the active
+        colors change.
+
+        Args:
+            current_route: Route of the view taking the sidebar.
+            on_navigate: Navigation callback of that view.
+
+        Returns:
+            Sidebar instance ready to be placed in the view.
+        """
+        colors = get_colors(self.page)
+        if self._sidebar is None or self._sidebar_colors is not colors:
+            self._sidebar = Sidebar(
+                current_route=current_route,
+                newsletters=self._sidebar.newsletters if self._sidebar else [],
+                on_navigate=on_navigate,
+                page=self.page,
+            )
+            self._sidebar_colors = colors
+        else:
+            self._sidebar.set_route(current_route, on_navigate)
+        return self._sidebar
+
+    def get_settings_page(self) -> ft.View:
+        """Get the settings view, reusing the previous one when possible.
+
+        The view is only rebuilt when the active colors changed since it was
+        built; otherwise the cached one is refreshed and returned.
+
+        Returns:
+            Settings view ready to be shown.
+        """
+        from src.ui.pages.settings_page import SettingsPage
+
+        settings_page = self._settings_page
+        if settings_page is None or settings_page.colors is not get_colors(self.page):
+            settings_page = SettingsPage(self)
+            self._settings_page = settings_page
+        else:
+            settings_page.refresh()
+        return settings_page
+
+    async def warm_settings_cache(self) -> None:
+        """Prefetch the user email and newsletter list into the app cache.
+
+        Scheduled in the background once the user is signed in, so the
+        settings page can paint from cache on its first visit.
+        """
+        async def fetch_email() -> Optional[str]:
+            if self.cached_user_email:
+                return self.cached_user_email
+            async with self._session_maker() as session:
+                return await AuthService(session).get_current_user_email()
+
+        async def fetch_newsletters() -> list:
+            async with self._session_maker() as session:
+                return await NewsletterService(session=session).get_all_newsletters()
+
+        try:
+            # Independent queries, run concurrently in their own sessions
+            email, newsletters = await asyncio.gather(
+                fetch_email(), fetch_newsletters()
+            )
+
+            if email:
+                self.cache_user_email(email)
+            self.cache_newsletters(newsletters)
+        except Exception as ex:
+            logger.warning(f"Failed to warm settings cache: {ex}")
+
+    def get_cached_user_email(self) -> Optional[str]:
+        """Get the signed-in user's email if already known.
+
+        The email does not change while signed in, so it is kept until
+        sign-out rather than expiring with the TTL.
+
+        Returns:
+            Cached email, or None if not loaded yet.
+        """
+        return self.cached_user_email
+
+    def cache_user_email(self, email: str) -> None:
+        """Cache the signed-in user's email.
+
+        Args:
+            email: User email address.
+        """
+        self.cached_user_email = email
+
+    def get_cached_newsletters(self) -> Optional[list]:
+        """Get the newsletter list if cached recently.
+
+        Returns:
+            Cached newsletters, or None if missing or stale.
+        """
+        return self._get_fresh(self._newsletters_cache)
+
+    def cache_newsletters(self, newsletters: list) -> None:
+        """Cache the newsletter list.
+
+        Args:
+            newsletters: Newsletters as loaded from the database.
+        """
+        self._newsletters_cache = (newsletters, time.monotonic())
+
+    def invalidate_newsletters_cache(self) -> None:
+        """Drop the cached newsletter list after newsletters or their counts change."""
+        self._newsletters_cache = None
+
+    def invalidate_session_cache(self) -> None:
+        """Drop cached user data and views, e.g. after signing out."""
+        self.cached_user_email = None
+        self._newsletters_cache = None
+        self._sidebar = None
+        self._settings_page = None
+
+    def _get_fresh(self, entry: Optional[tuple]):
+        """Return a cache entry's value if it is within the TTL."""
+        if entry is None:
+            return None
+        value, cached_at = entry
+        if time.monotonic() - cached_at > self.CACHE_TTL_SECONDS:
+            return None
+        return value
+
     async def shutdown(self) -> None:
         """Clean shutdown of application."""
         if self.scheduler_service:
@@ -377,6 +562,28 @@ class NewsletterApp:
         """
         self.page.go(route)
 
+    def batch_update(self) -> None:
+        """Request a page update, coalescing repeated requests.
+
+        Inside the event loop, any number of calls made before control
+        returns to the loop are flushed by a single page.update(). Outside
+        a running loop the page is updated immediately.
+        """
+        if self._update_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.page.update()
+            return
+        self._update_scheduled = True
+        loop.call_soon(self._flush_update)
+
+    def _flush_update(self) -> None:
+        """Run the page update scheduled by batch_update."""
+        self._update_scheduled = False
+        self.page.update()
+
     def show_snackbar(self, message: str, error: bool = False) -> None:
         """Show a snackbar message.
 
@@ -393,4 +600,4 @@ class NewsletterApp:
             bgcolor=Colors.Light.ERROR if error else Colors.Light.BG_TERTIARY,
         )
         self.page.snack_bar.open = True
-        self.page.update()
+        self.batch_update()
@@ -19,10 +19,10 @@ class UserSettings(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(primary_key=True, default=1)
 
     # Appearance
-    theme_mode: Mapped[str] = mapped_column(
+    theme_mode: Mapped[Optional[str]] = mapped_column(
         String(10),
-        default="system",
-    )  # light, dark, system
+        nullable=True,
+    )  # light, dark, system; None until the user picks a mode
 
     accent_color: Mapped[str] = mapped_column(
         String(7),
@@ -139,3 +139,18 @@ class UserSettingsRepository(BaseRepository[UserSettings]):
         settings.active_theme = theme_filename or "default.json"
         await self.session.flush()
         return settings
+
+    async def update_theme_mode(self, theme_mode: str | None) -> UserSettings:
+        """Update the appearance mode.
+
+        Args:
+            theme_mode: 'light', 'dark' or 'system', or None to clear the
+                choice and follow the active theme's base mode.
+
+        Returns:
+            Updated settings.
+        """
+        settings = await self.get_settings()
+        settings.theme_mode = theme_mode
+        await self.session.flush()
+        return settings
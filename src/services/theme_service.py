@@ -4,6 +4,7 @@ Handles loading, validating, applying, importing, and exporting themes.
 Includes built-in theme generation and persistence.
 """
 
+import functools
 import json
 import logging
 import shutil
@@ -14,6 +15,7 @@ from typing import Optional, Type
 from pydantic import ValidationError
 
 from src.config.settings import get_settings
+from src.ui.themes.builtin_themes import BUILTIN_THEME_FILES
 from src.ui.themes.design_tokens import Colors, set_active_theme_colors
 from src.ui.themes.dynamic_colors import create_colors_from_theme
 from src.ui.themes.theme_schema import ThemeSchema
@@ -21,31 +23,21 @@ from src.ui.themes.theme_schema import ThemeSchema
 logger = logging.getLogger(__name__)
 
 # Built-in theme names (used for UI badge display)
-BUILTIN_THEMES = frozenset({
-    # Original themes
-    "default.json",
-    "dark-slate.json",
-    "light-clean.json",
-    "midnight.json",
-    # Popular color schemes
-    "nord.json",
-    "solarized-light.json",
-    "solarized-dark.json",
-    "dracula.json",
-    "gruvbox-light.json",
-    "gruvbox-dark.json",
-    "catppuccin-latte.json",
-    "catppuccin-mocha.json",
-    "one-dark.json",
-    "tokyo-night.json",
-    # Glass effects
-    "liquid-glass.json",
-})
+BUILTIN_THEMES = BUILTIN_THEME_FILES
 
 # The default theme cannot be deleted (fallback/recovery theme)
 UNDELETABLE_THEME = "default.json"
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_theme(raw_json: str) -> ThemeSchema:
+    """Parse and validate theme JSON, cached by file contents.
+
+    The returned schema is shared between callers and must not be mutated.
+    """
+    return ThemeSchema.model_validate(json.loads(raw_json))
+
+
 @dataclass
 class ThemeInfo:
     """Theme information for display in UI."""
@@ -182,10 +174,7 @@ class ThemeService:
             return False, None, f"Theme file not found: {filename}"
 
         try:
-            with open(theme_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            theme = ThemeSchema.model_validate(data)
+            theme = _parse_theme(theme_path.read_text(encoding="utf-8"))
             return True, theme, None
 
         except json.JSONDecodeError as e:
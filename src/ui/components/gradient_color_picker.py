@@ -1,6 +1,7 @@
 """Gradient color picker component with HSV color picker popup."""
 
 import colorsys
+import functools
 import re
 import time
 from typing import Callable, Optional, Tuple
@@ -23,12 +24,25 @@ PRESET_GRADIENTS = [
 ]
 
 
+_HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Convert a validated "#RRGGBB" string to an (r, g, b) tuple of 0-255 ints.
+
+    Cached because the picker re-derives the same few colors on every
+    slider move, swatch render and preview update.
+    """
+    rgb = int(hex_color[1:], 16)
+    return (rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+
+
 def _get_contrast_color(hex_color: str) -> str:
     """Get contrasting text color (black or white) based on background luminance."""
     if not hex_color or not _is_valid_hex(hex_color):
         return "#000000"
-    hex_val = hex_color.lstrip("#")
-    r, g, b = int(hex_val[0:2], 16), int(hex_val[2:4], 16), int(hex_val[4:6], 16)
+    r, g, b = _hex_to_rgb(hex_color)
     luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
     return "#000000" if luminance > 0.5 else "#FFFFFF"
 
@@ -37,8 +51,7 @@ def _is_valid_hex(value: str) -> bool:
     """Check if a string is a valid hex color."""
     if not value:
         return False
-    pattern = r"^#[0-9A-Fa-f]{6}$"
-    return bool(re.match(pattern, value))
+    return bool(_HEX_COLOR_RE.match(value))
 
 
 def _hsv_to_hex(h: float, s: float, v: float) -> str:
@@ -67,11 +80,8 @@ def _hex_to_hsv(hex_color: str) -> Tuple[float, float, float]:
     """
     if not _is_valid_hex(hex_color):
         return (0.0, 1.0, 1.0)  # Default to red
-    hex_val = hex_color.lstrip("#")
-    r = int(hex_val[0:2], 16) / 255
-    g = int(hex_val[2:4], 16) / 255
-    b = int(hex_val[4:6], 16) / 255
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    r, g, b = _hex_to_rgb(hex_color)
+    h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
     return (h * 360, s, v)
 
 
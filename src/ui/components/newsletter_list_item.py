@@ -25,12 +25,14 @@ class NewsletterListItem(ft.Container):
         on_click: Optional[Callable] = None,
         on_refresh: Optional[Callable] = None,
         colors: Optional[Union[type[Colors.Light], type[Colors.Dark]]] = None,
+        now: Optional[datetime] = None,
     ):
         self.name = name
         self.label = label
         self.unread_count = unread_count
         self.total_count = total_count
         self.last_email_received_at = last_email_received_at
+        self._now = now
         self._colors = colors or Colors.Light
         self.accent_color = color or self._colors.ACCENT
         self.accent_color_secondary = color_secondary
@@ -120,7 +122,7 @@ class NewsletterListItem(ft.Container):
                 ),
                 # Recent activity
                 ft.Text(
-                    format_relative_time(self.last_email_received_at),
+                    format_relative_time(self.last_email_received_at, self._now),
                     size=Typography.CAPTION_SIZE,
                     color=c.TEXT_TERTIARY,
                     width=100,
@@ -28,6 +28,8 @@ class NavItem(ft.Container):
         self.is_active = is_active
         self._on_click = on_click
         self._colors = colors or Colors.Light
+        self._icon_name = icon
+        self._icon_filled_name = icon_filled
 
         # Build badge if needed
         badge = None
@@ -44,28 +46,31 @@ class NavItem(ft.Container):
                 padding=ft.padding.symmetric(horizontal=6, vertical=2),
             )
 
+        self._icon = ft.Icon(
+            icon_filled if is_active else icon,
+            size=20,
+            color=self._colors.TEXT_PRIMARY
+            if is_active
+            else self._colors.TEXT_SECONDARY,
+        )
+        self._label = ft.Text(
+            label,
+            size=Typography.BODY_SIZE,
+            weight=ft.FontWeight.W_500
+            if is_active
+            else ft.FontWeight.W_400,
+            color=self._colors.TEXT_PRIMARY
+            if is_active
+            else self._colors.TEXT_SECONDARY,
+            expand=True,
+        )
+
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(
-                        icon_filled if is_active else icon,
-                        size=20,
-                        color=self._colors.TEXT_PRIMARY
-                        if is_active
-                        else self._colors.TEXT_SECONDARY,
-                    ),
+                    self._icon,
                     ft.Container(width=Spacing.SM),
-                    ft.Text(
-                        label,
-                        size=Typography.BODY_SIZE,
-                        weight=ft.FontWeight.W_500
-                        if is_active
-                        else ft.FontWeight.W_400,
-                        color=self._colors.TEXT_PRIMARY
-                        if is_active
-                        else self._colors.TEXT_SECONDARY,
-                        expand=True,
-                    ),
+                    self._label,
                     badge if badge else ft.Container(),
                 ],
             ),
@@ -76,6 +81,22 @@ class NavItem(ft.Container):
             on_hover=self._on_hover,
         )
 
+    def set_active(self, is_active: bool) -> None:
+        """Restyle the item as active or inactive without rebuilding it."""
+        self.is_active = is_active
+        text_color = (
+            self._colors.TEXT_PRIMARY if is_active else self._colors.TEXT_SECONDARY
+        )
+        self._icon.icon = self._icon_filled_name if is_active else self._icon_name
+        self._icon.color = text_color
+        self._label.weight = ft.FontWeight.W_500 if is_active else ft.FontWeight.W_400
+        self._label.color = text_color
+        self.bgcolor = self._colors.BG_TERTIARY if is_active else None
+
+    def set_on_click(self, on_click: Optional[Callable]) -> None:
+        """Set the callback invoked with this item's route on click."""
+        self._on_click = on_click
+
     def _handle_click(self, e: ft.ControlEvent) -> None:
         if self._on_click:
             self._on_click(self.route)
@@ -159,6 +180,15 @@ class NewsletterNavItem(ft.Container):
             on_hover=self._on_hover,
         )
 
+    def set_active(self, is_active: bool) -> None:
+        """Show or hide the active border without rebuilding the item."""
+        self.is_active = is_active
+        self.border = ft.border.all(2, "#FFFFFF") if is_active else None
+
+    def set_on_click(self, on_click: Optional[Callable]) -> None:
+        """Set the callback invoked with this newsletter's route on click."""
+        self._on_click = on_click
+
     def _handle_click(self, e: ft.ControlEvent) -> None:
         if self._on_click:
             self._on_click(f"/newsletter/{self.newsletter_id}")
@@ -192,6 +222,12 @@ class Sidebar(ft.Container):
         self.user_email = user_email
         self._colors = get_colors(page) if page else Colors.Light
 
+        # Newsletter rows by id, reused while their data is unchanged
+        self._newsletter_items: dict[int, tuple[tuple, NewsletterNavItem]] = {}
+        self._newsletters_signature: list[tuple] = []
+        self._newsletters_slot = ft.Container()
+        self._nav_items: list[NavItem] = []
+
         super().__init__(
             content=self._build_content(),
             width=self.WIDTH,
@@ -202,47 +238,53 @@ class Sidebar(ft.Container):
 
     def _build_content(self) -> ft.Control:
         """Build sidebar content."""
+        self._newsletters_slot.content = self._build_newsletters_section()
+        home = NavItem(
+            icon=ft.Icons.HOME_OUTLINED,
+            icon_filled=ft.Icons.HOME,
+            label="Home",
+            route="/home",
+            is_active=self.current_route == "/home",
+            on_click=self.on_navigate,
+            colors=self._colors,
+        )
+        manage = NavItem(
+            icon=ft.Icons.FOLDER_OUTLINED,
+            icon_filled=ft.Icons.FOLDER,
+            label="Manage",
+            route="/newsletters",
+            is_active=self.current_route == "/newsletters",
+            on_click=self.on_navigate,
+            colors=self._colors,
+        )
+        settings = NavItem(
+            icon=ft.Icons.SETTINGS_OUTLINED,
+            icon_filled=ft.Icons.SETTINGS,
+            label="Settings",
+            route="/settings",
+            is_active=self.current_route == "/settings",
+            on_click=self.on_navigate,
+            colors=self._colors,
+        )
+        # Kept so route changes restyle them in place
+        self._nav_items = [home, manage, settings]
         return ft.Column(
             [
                 # Logo/Brand
                 self._build_header(),
                 ft.Container(height=Spacing.LG),
                 # Primary nav
-                NavItem(
-                    icon=ft.Icons.HOME_OUTLINED,
-                    icon_filled=ft.Icons.HOME,
-                    label="Home",
-                    route="/home",
-                    is_active=self.current_route == "/home",
-                    on_click=self.on_navigate,
-                    colors=self._colors,
-                ),
+                home,
                 ft.Container(height=Spacing.LG),
-                # Newsletters section
-                self._build_newsletters_section(),
+                # Newsletters section (replaced in place on updates)
+                self._newsletters_slot,
                 # Spacer
                 ft.Container(expand=True),
                 # Footer nav
                 ft.Divider(height=1, color=self._colors.BORDER_SUBTLE),
                 ft.Container(height=Spacing.SM),
-                NavItem(
-                    icon=ft.Icons.FOLDER_OUTLINED,
-                    icon_filled=ft.Icons.FOLDER,
-                    label="Manage",
-                    route="/newsletters",
-                    is_active=self.current_route == "/newsletters",
-                    on_click=self.on_navigate,
-                    colors=self._colors,
-                ),
-                NavItem(
-                    icon=ft.Icons.SETTINGS_OUTLINED,
-                    icon_filled=ft.Icons.SETTINGS,
-                    label="Settings",
-                    route="/settings",
-                    is_active=self.current_route == "/settings",
-                    on_click=self.on_navigate,
-                    colors=self._colors,
-                ),
+                manage,
+                settings,
             ],
             expand=True,
             spacing=2,
@@ -272,14 +314,25 @@ class Sidebar(ft.Container):
 
     def _build_newsletters_section(self) -> ft.Control:
         """Build newsletters list section."""
+        self._newsletters_signature = [
+            self._newsletter_signature(nl) for nl in self.newsletters
+        ]
         if not self.newsletters:
+            self._newsletter_items = {}
             return ft.Container()
 
+        items = {}
         newsletter_items = []
         for nl in self.newsletters:
             is_active = self.current_route == f"/newsletter/{nl.id}"
-            newsletter_items.append(
-                NewsletterNavItem(
+            key = self._newsletter_signature(nl)
+            cached = self._newsletter_items.get(nl.id)
+            if cached is not None and cached[0] == key:
+                item = cached[1]
+                item.set_active(is_active)
+                item.set_on_click(self.on_navigate)
+            else:
+                item = NewsletterNavItem(
                     newsletter_id=nl.id,
                     name=nl.name,
                     color=nl.color or self._colors.ACCENT,
@@ -288,7 +341,9 @@ class Sidebar(ft.Container):
                     is_active=is_active,
                     on_click=self.on_navigate,
                 )
-            )
+            items[nl.id] = (key, item)
+            newsletter_items.append(item)
+        self._newsletter_items = items
 
         return ft.Column(
             [
@@ -312,14 +367,57 @@ class Sidebar(ft.Container):
             spacing=0,
         )
 
+    @staticmethod
+    def _newsletter_signature(newsletter) -> tuple:
+        """Get the values a newsletter row is rendered from."""
+        return (
+            newsletter.id,
+            newsletter.name,
+            newsletter.color,
+            newsletter.color_secondary,
+            newsletter.unread_count,
+        )
+
     def update_newsletters(self, newsletters: list) -> None:
-        """Update the newsletters list."""
+        """Update the newsletters list.
+
+        Does nothing if the rendered values are unchanged; otherwise only the
+        newsletters section is rebuilt, reusing rows that did not change.
+        """
+        signature = [self._newsletter_signature(nl) for nl in newsletters]
         self.newsletters = newsletters
-        self.content = self._build_content()
-        self.update()
+        if signature == self._newsletters_signature:
+            return
+        self._newsletters_slot.content = self._build_newsletters_section()
+        self._newsletters_slot.update()
+
+    def _apply_route(self) -> None:
+        """Mark the items matching current_route as active, in place."""
+        for nav_item in self._nav_items:
+            nav_item.set_active(self.current_route == nav_item.route)
+            nav_item.set_on_click(self.on_navigate)
+        for _, item in self._newsletter_items.values():
+            item.set_active(self.current_route == f"/newsletter/{item.newsletter_id}")
+            item.set_on_click(self.on_navigate)
 
     def update_route(self, route: str) -> None:
         """Update the current route."""
         self.current_route = route
-        self.content = self._build_content()
+        self._apply_route()
         self.update()
+
+    def set_route(self, route: str, on_navigate: Optional[Callable] = None) -> None:
+        """Point the sidebar at a route before it is placed in a new view.
+
+        Only the active state of the existing items changes. Unlike
+        update_route, this does not push an update, so it is safe to call
+        while the next view is still being constructed.
+
+        Args:
+            route: Route to mark as active.
+            on_navigate: Navigation callback of the view taking the sidebar.
+        """
+        self.current_route = route
+        if on_navigate is not None:
+            self.on_navigate = on_navigate
+        self._apply_route()
@@ -9,7 +9,7 @@ import flet as ft
 from src.services.email_service import EmailService
 from src.services.fetch_queue_service import FetchPriority
 from src.services.newsletter_service import NewsletterService
-from src.ui.components import EmailListItem, Sidebar
+from src.ui.components import EmailListItem
 from src.ui.components.dialogs import EditNewsletterDialog
 from src.ui.themes import BorderRadius, Colors, Spacing, Typography, get_colors
 
@@ -96,12 +96,7 @@ class EmailListPage(ft.View):
             color=self.colors.TEXT_PRIMARY,
         )
 
-        self.sidebar = Sidebar(
-            current_route=f"/newsletter/{newsletter_id}",
-            newsletters=[],
-            on_navigate=self._handle_navigate,
-            page=self.app.page,
-        )
+        self.sidebar = self.app.get_sidebar(f"/newsletter/{newsletter_id}", self._handle_navigate)
 
         # Empty state elements (stored as instance vars for dynamic updates)
         self.empty_state_heading = ft.Text(
@@ -366,6 +361,7 @@ class EmailListPage(ft.View):
                 # Load all newsletters for sidebar
                 newsletter_service = NewsletterService(session=session)
                 self.newsletters = await newsletter_service.get_all_newsletters()
+                self.app.cache_newsletters(self.newsletters)
 
                 # Load current newsletter
                 self.newsletter = await newsletter_service.get_newsletter(
@@ -430,7 +426,6 @@ class EmailListPage(ft.View):
 
             # Update sidebar
             self.sidebar.update_newsletters(self.newsletters)
-            self.sidebar.update_route(f"/newsletter/{self.newsletter_id}")
 
             # Update email list
             self.emails_list.controls.clear()
@@ -516,6 +511,7 @@ class EmailListPage(ft.View):
                         color=values.get("color"),
                         color_secondary=values.get("color_secondary"),
                     )
+                self.app.invalidate_newsletters_cache()
 
                 dialog.open = False
                 self.app.page.update()
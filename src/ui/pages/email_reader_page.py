@@ -10,7 +10,7 @@ from flet_webview import WebView
 from src.repositories.user_settings_repository import UserSettingsRepository
 from src.services.email_service import EmailService
 from src.services.newsletter_service import NewsletterService
-from src.ui.components import Sidebar, SummaryCard
+from src.ui.components import SummaryCard
 from src.ui.themes import BorderRadius, Spacing, Typography, get_colors
 from src.utils.html_sanitizer import sanitize_html_for_webview
 
@@ -94,12 +94,7 @@ class EmailReaderPage(ft.View):
             on_click=lambda e: self.app.page.run_task(self._toggle_archive, e),
         )
 
-        self.sidebar = Sidebar(
-            current_route=f"/email/{email_id}",
-            newsletters=[],
-            on_navigate=self._handle_navigate,
-            page=self.app.page,
-        )
+        self.sidebar = self.app.get_sidebar(f"/email/{email_id}", self._handle_navigate)
 
         self.controls = [self._build_content()]
 
@@ -207,9 +202,12 @@ class EmailReaderPage(ft.View):
                     self._go_back(None)
                     return
 
-                # Mark as read
+                # Mark as read; the loaded unread counts are then stale
                 if not self.email.is_read:
                     await email_service.mark_as_read(self.email_id)
+                    self.app.invalidate_newsletters_cache()
+                else:
+                    self.app.cache_newsletters(self.newsletters)
 
             # Update sidebar
             self.sidebar.update_newsletters(self.newsletters)
@@ -391,6 +389,7 @@ class EmailReaderPage(ft.View):
             async with self.app.get_session() as session:
                 email_service = EmailService(session)
                 await email_service.mark_as_unread(self.email_id)
+            self.app.invalidate_newsletters_cache()
 
             self.app.show_snackbar("Marked as unread")
             self._go_back(None)
@@ -408,6 +407,7 @@ class EmailReaderPage(ft.View):
                 else:
                     await email_service.archive_email(self.email_id)
                     self.app.show_snackbar("Email archived")
+            self.app.invalidate_newsletters_cache()
 
             self._go_back(None)
         except Exception as ex:
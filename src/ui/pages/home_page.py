@@ -8,7 +8,6 @@ import flet as ft
 from src.models.newsletter import Newsletter
 from src.services.fetch_queue_service import FetchPriority
 from src.services.newsletter_service import NewsletterService
-from src.ui.components import Sidebar
 from src.ui.components.newsletter_list_item import NewsletterListItem
 from src.ui.components.search_bar import SearchBar
 from src.ui.components.sort_dropdown import SortDropdown
@@ -107,12 +106,7 @@ class HomePage(ft.View):
             visible=False,
         )
 
-        self.sidebar = Sidebar(
-            current_route="/home",
-            newsletters=[],
-            on_navigate=self._handle_navigate,
-            page=self.app.page,
-        )
+        self.sidebar = self.app.get_sidebar("/home", self._handle_navigate)
 
         self.controls = [self._build_content()]
 
@@ -215,12 +209,12 @@ class HomePage(ft.View):
                     gmail_service=self.app.gmail_service,
                 )
                 self.newsletters = list(await service.get_all_newsletters())
+            self.app.cache_newsletters(self.newsletters)
 
             self._render_newsletters()
 
-            if self.newsletters:
-                # Update sidebar with newsletters
-                self.sidebar.update_newsletters(self.newsletters)
+            # Update the shared sidebar (no-op if its list is unchanged)
+            self.sidebar.update_newsletters(self.newsletters)
 
         except Exception as ex:
             self.app.show_snackbar(f"Error loading newsletters: {ex}", error=True)
@@ -228,7 +222,9 @@ class HomePage(ft.View):
             self.loading.visible = False
             self.app.page.update()
 
-    def _create_newsletter_list_item(self, newsletter: Newsletter) -> ft.Control:
+    def _create_newsletter_list_item(
+        self, newsletter: Newsletter, now: datetime | None = None
+    ) -> ft.Control:
         """Create a list item for a newsletter."""
         return NewsletterListItem(
             name=newsletter.name,
@@ -245,6 +241,7 @@ class HomePage(ft.View):
                 self._fetch_newsletter, nid
             ),
             colors=self.colors,
+            now=now,
         )
 
     async def _on_refresh_all(self, e: ft.ControlEvent) -> None:
@@ -324,6 +321,7 @@ class HomePage(ft.View):
         self.empty_state.visible = False
         self.newsletters_list.visible = True
 
+        now = datetime.now(timezone.utc)
         for newsletter in filtered:
-            item = self._create_newsletter_list_item(newsletter)
+            item = self._create_newsletter_list_item(newsletter, now)
             self.newsletters_list.controls.append(item)
@@ -42,6 +42,44 @@ class LoginPage(ft.View):
             visible=False,
         )
 
+        self.sign_in_button = ft.ElevatedButton(
+            content=ft.Row(
+                [
+                    self.loading,
+                    ft.Container(width=Spacing.XS)
+                    if not self.loading.visible
+                    else ft.Container(),
+                    ft.Icon(
+                        ft.Icons.LOGIN,
+                        size=18,
+                        color="#FFFFFF",
+                    ),
+                    ft.Container(width=Spacing.XS),
+                    ft.Text(
+                        "Sign in with Google",
+                        size=Typography.BODY_SIZE,
+                        weight=ft.FontWeight.W_500,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.CENTER,
+                spacing=0,
+            ),
+            bgcolor=self.colors.ACCENT,
+            color="#FFFFFF",
+            height=48,
+            width=240,
+            style=ft.ButtonStyle(
+                shape=ft.RoundedRectangleBorder(radius=BorderRadius.SM),
+                elevation=0,
+            ),
+            on_click=lambda e: self.app.page.run_task(
+                self._on_sign_in, e
+            ),
+        )
+
+        # Set while an OAuth flow is running, to ignore repeat clicks
+        self._signing_in = False
+
         self.controls = [self._build_content()]
 
     def _build_content(self) -> ft.Control:
@@ -93,40 +131,7 @@ class LoginPage(ft.View):
                     ft.Container(height=Spacing.MD),
                     # Sign in button
                     ft.Container(
-                        content=ft.ElevatedButton(
-                            content=ft.Row(
-                                [
-                                    self.loading,
-                                    ft.Container(width=Spacing.XS)
-                                    if not self.loading.visible
-                                    else ft.Container(),
-                                    ft.Icon(
-                                        ft.Icons.LOGIN,
-                                        size=18,
-                                        color="#FFFFFF",
-                                    ),
-                                    ft.Container(width=Spacing.XS),
-                                    ft.Text(
-                                        "Sign in with Google",
-                                        size=Typography.BODY_SIZE,
-                                        weight=ft.FontWeight.W_500,
-                                    ),
-                                ],
-                                alignment=ft.MainAxisAlignment.CENTER,
-                                spacing=0,
-                            ),
-                            bgcolor=c.ACCENT,
-                            color="#FFFFFF",
-                            height=48,
-                            width=240,
-                            style=ft.ButtonStyle(
-                                shape=ft.RoundedRectangleBorder(radius=BorderRadius.SM),
-                                elevation=0,
-                            ),
-                            on_click=lambda e: self.app.page.run_task(
-                                self._on_sign_in, e
-                            ),
-                        ),
+                        content=self.sign_in_button,
                     ),
                     ft.Container(expand=True),
                     # Footer
@@ -145,7 +150,15 @@ class LoginPage(ft.View):
         )
 
     async def _on_sign_in(self, e: ft.ControlEvent) -> None:
-        """Handle sign in button click."""
+        """Handle sign in button click.
+
+        Repeat clicks while a sign in is in flight are ignored, so only one
+        OAuth flow and session run at a time.
+        """
+        if self._signing_in:
+            return
+        self._signing_in = True
+        self.sign_in_button.disabled = True
         self.loading.visible = True
         self.error_text.visible = False
         self.status_text.value = "Opening browser for authentication..."
@@ -174,13 +187,18 @@ class LoginPage(ft.View):
                             real_email,
                         )
 
+                    if real_email:
+                        self.app.cache_user_email(real_email)
                     self.app.show_snackbar(f"Signed in as {real_email}")
+                    self.app.page.run_task(self.app.warm_settings_cache)
                     self.app.navigate("/home")
                 else:
                     self._show_error(auth_result.error or "Authentication failed")
         except Exception as ex:
             self._show_error(f"Error: {str(ex)}")
         finally:
+            self._signing_in = False
+            self.sign_in_button.disabled = False
             self.loading.visible = False
             self.status_text.visible = False
             self.app.page.update()
@@ -6,7 +6,7 @@ import flet as ft
 
 from src.services.fetch_queue_service import FetchPriority
 from src.services.newsletter_service import NewsletterService
-from src.ui.components import AddNewsletterDialog, ConfirmDialog, EditNewsletterDialog, Sidebar
+from src.ui.components import AddNewsletterDialog, ConfirmDialog, EditNewsletterDialog
 from src.ui.components.gradient_dot import create_gradient_dot
 from src.ui.themes import BorderRadius, Colors, Spacing, Typography, get_colors
 
@@ -207,12 +207,7 @@ class NewslettersPage(ft.View):
             visible=False,
         )
 
-        self.sidebar = Sidebar(
-            current_route="/newsletters",
-            newsletters=[],
-            on_navigate=self._handle_navigate,
-            page=self.app.page,
-        )
+        self.sidebar = self.app.get_sidebar("/newsletters", self._handle_navigate)
 
         self.controls = [self._build_content()]
 
@@ -317,6 +312,7 @@ class NewslettersPage(ft.View):
             async with self.app.get_session() as session:
                 service = NewsletterService(session=session)
                 self.newsletters = await service.get_all_newsletters()
+            self.app.cache_newsletters(self.newsletters)
 
             # Update sidebar
             self.sidebar.update_newsletters(self.newsletters)
@@ -392,6 +388,7 @@ class NewslettersPage(ft.View):
                         color=values.get("color"),
                         color_secondary=values.get("color_secondary"),
                     )
+                self.app.invalidate_newsletters_cache()
 
                 # Queue initial email fetch
                 if self.app.fetch_queue_service:
@@ -441,6 +438,7 @@ class NewslettersPage(ft.View):
                         color=values.get("color"),
                         color_secondary=values.get("color_secondary"),
                     )
+                self.app.invalidate_newsletters_cache()
 
                 dialog.open = False
                 self.app.page.update()
@@ -470,6 +468,7 @@ class NewslettersPage(ft.View):
                 async with self.app.get_session() as session:
                     service = NewsletterService(session=session)
                     await service.delete_newsletter(newsletter.id)
+                self.app.invalidate_newsletters_cache()
 
                 dialog.open = False
                 self.app.page.update()
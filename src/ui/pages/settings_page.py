@@ -1,25 +1,185 @@
 """Settings page for app configuration with sophisticated styling."""
 
+import asyncio
+import functools
 import logging
+import re
+import uuid
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import flet as ft
 
-logger = logging.getLogger(__name__)
-
+from src.config.settings import get_settings
 from src.repositories.user_settings_repository import UserSettingsRepository
 from src.services.auth_service import AuthService
 from src.services.llm_service import LLMService
 from src.services.newsletter_service import NewsletterService
 from src.services.theme_service import ThemeService
-from src.ui.components import ConfirmDialog, Sidebar
+from src.ui.components import ConfirmDialog
 from src.ui.components.theme_settings import ThemeSettings
-from src.ui.themes import BorderRadius, Spacing, Typography, get_colors, set_active_theme_colors
+from src.ui.themes import AppTheme, BorderRadius, Spacing, Typography, get_colors
 
 if TYPE_CHECKING:
     from src.app import NewsletterApp
 
+logger = logging.getLogger(__name__)
+
+# Color-independent styles, shared by every settings page build
+_SM_SHAPE = ft.RoundedRectangleBorder(radius=BorderRadius.SM)
+_ICON_BUTTON_STYLE = ft.ButtonStyle(shape=_SM_SHAPE)
+_HEADER_PADDING = ft.padding.only(bottom=Spacing.XL)
+_DROPDOWN_PADDING = ft.padding.symmetric(horizontal=Spacing.SM, vertical=Spacing.SM)
+
+# Appearance dropdown option keys <-> page theme modes
+_MODE_TO_STR = {
+    ft.ThemeMode.SYSTEM: "system",
+    ft.ThemeMode.LIGHT: "light",
+    ft.ThemeMode.DARK: "dark",
+}
+_STR_TO_MODE = {value: mode for mode, value in _MODE_TO_STR.items()}
+
+# Minimal shape of an LLM API base URL, checked before anything is saved
+_LLM_URL_RE = re.compile(r"^https?://[^\s/?#]+\S*$")
+
+# A themed property is either a palette attribute name or a function of the palette
+_ColorToken = str | Callable[[type], object]
+# Registers a control's themed properties and returns the control (SettingsPage._themed)
+_Themer = Callable[..., ft.Control]
+
+
+@functools.lru_cache(maxsize=8)
+def _field_text_style(colors: type) -> ft.TextStyle:
+    """Input text style, shared by all fields for a color palette."""
+    return ft.TextStyle(size=Typography.BODY_SIZE, color=colors.TEXT_PRIMARY)
+
+
+@functools.lru_cache(maxsize=8)
+def _field_label_style(colors: type) -> ft.TextStyle:
+    """Input label style, shared by all fields for a color palette."""
+    return ft.TextStyle(color=colors.TEXT_SECONDARY)
+
+
+def _card_border(colors: type) -> ft.Border:
+    """Border of a settings section card."""
+    return ft.border.all(1, colors.BORDER_DEFAULT)
+
+
+def _outlined_button_style(colors: type) -> ft.ButtonStyle:
+    """Style of the outlined Test Connection button."""
+    return ft.ButtonStyle(side=ft.BorderSide(1, colors.BORDER_DEFAULT), shape=_SM_SHAPE)
+
+
+def _sign_out_button_style(colors: type) -> ft.ButtonStyle:
+    """Style of the destructive Sign Out button."""
+    return ft.ButtonStyle(side=ft.BorderSide(1, colors.ERROR), shape=_SM_SHAPE)
+
+
+def _set_value(control: ft.Control, value: object, attr: str = "value") -> bool:
+    """Set a control property only if it differs from the current one.
+
+    Args:
+        control: Control to update.
+        value: New property value.
+        attr: Property name.
+
+    Returns:
+        True if the property changed and the control needs pushing.
+    """
+    if getattr(control, attr) == value:
+        return False
+    setattr(control, attr, value)
+    return True
+
+
+def _make_header(themed: _Themer, on_back: Callable[[ft.ControlEvent], None]) -> ft.Control:
+    """Build the page header with back button and title.
+
+    Args:
+        themed: The page's themed-control registrar.
+        on_back: Back button click handler.
+
+    Returns:
+        Header control.
+    """
+    return ft.Container(
+        content=ft.Row(
+            [
+                themed(
+                    ft.IconButton(
+                        icon=ft.Icons.ARROW_BACK,
+                        icon_size=20,
+                        style=_ICON_BUTTON_STYLE,
+                        on_click=on_back,
+                    ),
+                    icon_color="TEXT_SECONDARY",
+                ),
+                ft.Container(width=Spacing.XS),
+                themed(
+                    ft.Text(
+                        "Settings",
+                        size=Typography.H1_SIZE,
+                        weight=ft.FontWeight.W_600,
+                    ),
+                    color="TEXT_PRIMARY",
+                ),
+            ],
+        ),
+        padding=_HEADER_PADDING,
+    )
+
+
+def _make_about_section(themed: _Themer) -> ft.Control:
+    """Build the about section content.
+
+    Args:
+        themed: The page's themed-control registrar.
+
+    Returns:
+        About section content.
+    """
+    xs, sm = Spacing.XS, Spacing.SM
+    return ft.Column(
+        [
+            ft.Row(
+                [
+                    themed(
+                        ft.Icon(ft.Icons.MARK_EMAIL_READ, size=20),
+                        color="ACCENT",
+                    ),
+                    ft.Container(width=xs),
+                    themed(
+                        ft.Text(
+                            "Mr Newsletter",
+                            size=Typography.BODY_SIZE,
+                            weight=ft.FontWeight.W_500,
+                        ),
+                        color="TEXT_PRIMARY",
+                    ),
+                ],
+            ),
+            ft.Container(height=xs),
+            themed(
+                ft.Text(
+                    "Version 0.1.0",
+                    size=Typography.CAPTION_SIZE,
+                    font_family="monospace",
+                ),
+                color="TEXT_TERTIARY",
+            ),
+            ft.Container(height=sm),
+            themed(
+                ft.Text(
+                    "A newsletter reader with Gmail.",
+                    size=Typography.BODY_SMALL_SIZE,
+                ),
+                color="TEXT_SECONDARY",
+            ),
+        ],
+        spacing=0,
+    )
+
 
 class SettingsPage(ft.View):
     """Settings page for app configuration with sidebar."""
@@ -32,40 +192,33 @@ class SettingsPage(ft.View):
         # Get theme-aware colors
         self.colors = get_colors(self.app.page)
 
-        self.user_email_text = ft.Text(
-            "Loading...",
-            size=Typography.BODY_SIZE,
-            color=self.colors.TEXT_SECONDARY,
-        )
+        # Controls colored from the palette, recolored in place on theme changes
+        self._themed_controls: list[tuple[ft.Control, dict[str, _ColorToken]]] = []
 
-        # Determine current theme value for dropdown
-        theme_value = "system"
-        if self.app.page.theme_mode == ft.ThemeMode.LIGHT:
-            theme_value = "light"
-        elif self.app.page.theme_mode == ft.ThemeMode.DARK:
-            theme_value = "dark"
-
-        self.theme_dropdown = ft.Dropdown(
-            label="Theme",
-            value=theme_value,
-            options=[
-                ft.dropdown.Option("system", "System"),
-                ft.dropdown.Option("light", "Light"),
-                ft.dropdown.Option("dark", "Dark"),
-            ],
-            width=200,
-            border_radius=BorderRadius.SM,
-            content_padding=ft.padding.symmetric(
-                horizontal=Spacing.SM, vertical=Spacing.SM
-            ),
-            text_size=Typography.BODY_SIZE,
-            text_style=ft.TextStyle(
+        self.user_email_text = self._themed(
+            ft.Text(
+                self.app.get_cached_user_email() or "Loading...",
                 size=Typography.BODY_SIZE,
-                color=self.colors.TEXT_PRIMARY,
             ),
-            label_style=ft.TextStyle(
-                color=self.colors.TEXT_SECONDARY,
+            color="TEXT_SECONDARY",
+        )
+
+        self.theme_dropdown = self._themed(
+            ft.Dropdown(
+                label="Theme",
+                value=self._theme_mode_value(),
+                options=[
+                    ft.dropdown.Option("system", "System"),
+                    ft.dropdown.Option("light", "Light"),
+                    ft.dropdown.Option("dark", "Dark"),
+                ],
+                width=200,
+                border_radius=BorderRadius.SM,
+                content_padding=_DROPDOWN_PADDING,
+                text_size=Typography.BODY_SIZE,
             ),
+            text_style=_field_text_style,
+            label_style=_field_label_style,
         )
         self.theme_dropdown.on_select = self._on_appearance_mode_change
 
@@ -76,100 +229,121 @@ class SettingsPage(ft.View):
         self._llm_max_tokens = 500
         self._llm_temperature = 0.3
         self._llm_has_api_key = False  # Track if API key is set (don't show actual key)
-
-        # LLM UI controls
-        c = self.colors
-        self.llm_enabled_switch = ft.Switch(
-            value=self._llm_enabled,
-            active_color=c.ACCENT,
-            on_change=lambda e: self.app.page.run_task(self._on_llm_toggle, e),
-        )
-        self.llm_api_url_field = ft.TextField(
-            label="API Base URL",
-            value=self._llm_api_base_url,
-            hint_text="http://localhost:1234/v1",
-            border_radius=BorderRadius.SM,
-            text_size=Typography.BODY_SIZE,
-            text_style=ft.TextStyle(size=Typography.BODY_SIZE, color=c.TEXT_PRIMARY),
-            label_style=ft.TextStyle(color=c.TEXT_SECONDARY),
-            on_blur=lambda e: self.app.page.run_task(self._on_llm_url_change, e),
+        self._llm_status_color = "TEXT_TERTIARY"  # Palette attribute of the status text
+
+        # LLM UI controls; async handlers are bound once as run_task partials
+        run_task = self.app.page.run_task
+        field_colors = {
+            "text_style": _field_text_style,
+            "label_style": _field_label_style,
+        }
+        self.llm_enabled_switch = self._themed(
+            ft.Switch(
+                value=self._llm_enabled,
+                on_change=functools.partial(run_task, self._on_llm_toggle),
+            ),
+            active_color="ACCENT",
         )
-        self.llm_api_key_field = ft.TextField(
-            label="API Key (optional for local)",
-            value="",
-            password=True,
-            can_reveal_password=True,
-            hint_text="Leave empty for LM Studio",
-            border_radius=BorderRadius.SM,
-            text_size=Typography.BODY_SIZE,
-            text_style=ft.TextStyle(size=Typography.BODY_SIZE, color=c.TEXT_PRIMARY),
-            label_style=ft.TextStyle(color=c.TEXT_SECONDARY),
-            on_blur=lambda e: self.app.page.run_task(self._on_api_key_change, e),
+        self.llm_api_url_field = self._themed(
+            ft.TextField(
+                label="API Base URL",
+                value=self._llm_api_base_url,
+                hint_text="http://localhost:1234/v1",
+                border_radius=BorderRadius.SM,
+                text_size=Typography.BODY_SIZE,
+                on_blur=functools.partial(run_task, self._on_llm_url_change),
+            ),
+            **field_colors,
         )
-        self.llm_model_field = ft.TextField(
-            label="Model Name",
-            value=self._llm_model,
-            hint_text="Leave empty for server default",
-            border_radius=BorderRadius.SM,
-            text_size=Typography.BODY_SIZE,
-            text_style=ft.TextStyle(size=Typography.BODY_SIZE, color=c.TEXT_PRIMARY),
-            label_style=ft.TextStyle(color=c.TEXT_SECONDARY),
-            on_blur=lambda e: self.app.page.run_task(self._on_llm_model_change, e),
+        self.llm_api_key_field = self._themed(
+            ft.TextField(
+                label="API Key (optional for local)",
+                value="",
+                password=True,
+                can_reveal_password=True,
+                hint_text="Leave empty for LM Studio",
+                border_radius=BorderRadius.SM,
+                text_size=Typography.BODY_SIZE,
+                on_blur=functools.partial(run_task, self._on_api_key_change),
+            ),
+            **field_colors,
         )
-        self.llm_max_tokens_field = ft.TextField(
-            label="Max Tokens",
-            value=str(self._llm_max_tokens),
-            hint_text="500",
-            width=120,
-            keyboard_type=ft.KeyboardType.NUMBER,
-            border_radius=BorderRadius.SM,
-            text_size=Typography.BODY_SIZE,
-            text_style=ft.TextStyle(size=Typography.BODY_SIZE, color=c.TEXT_PRIMARY),
-            label_style=ft.TextStyle(color=c.TEXT_SECONDARY),
-            on_blur=lambda e: self.app.page.run_task(self._on_max_tokens_change, e),
+        self.llm_model_field = self._themed(
+            ft.TextField(
+                label="Model Name",
+                value=self._llm_model,
+                hint_text="Leave empty for server default",
+                border_radius=BorderRadius.SM,
+                text_size=Typography.BODY_SIZE,
+                on_blur=functools.partial(run_task, self._on_llm_model_change),
+            ),
+            **field_colors,
         )
-        self.llm_temperature_slider = ft.Slider(
-            value=self._llm_temperature,
-            min=0,
-            max=1,
-            divisions=10,
-            label="{value}",
-            active_color=c.ACCENT,
-            on_change_end=lambda e: self.app.page.run_task(self._on_temperature_change, e),
+        self.llm_max_tokens_field = self._themed(
+            ft.TextField(
+                label="Max Tokens",
+                value=str(self._llm_max_tokens),
+                hint_text="500",
+                width=120,
+                keyboard_type=ft.KeyboardType.NUMBER,
+                border_radius=BorderRadius.SM,
+                text_size=Typography.BODY_SIZE,
+                on_blur=functools.partial(run_task, self._on_max_tokens_change),
+            ),
+            **field_colors,
         )
-        self.llm_temperature_label = ft.Text(
-            f"{self._llm_temperature:.1f}",
-            size=Typography.BODY_SIZE,
-            color=c.TEXT_PRIMARY,
-            width=30,
+        self.llm_temperature_slider = self._themed(
+            ft.Slider(
+                value=self._llm_temperature,
+                min=0,
+                max=1,
+                divisions=10,
+                label="{value}",
+                on_change_end=functools.partial(run_task, self._on_temperature_change),
+            ),
+            active_color="ACCENT",
         )
-        self.llm_connection_status = ft.Text(
-            "",
-            size=Typography.CAPTION_SIZE,
-            color=c.TEXT_TERTIARY,
+        self.llm_temperature_label = self._themed(
+            ft.Text(
+                f"{self._llm_temperature:.1f}",
+                size=Typography.BODY_SIZE,
+                width=30,
+            ),
+            color="TEXT_PRIMARY",
         )
-        self.llm_test_button = ft.OutlinedButton(
-            content=ft.Row(
-                [
-                    ft.Icon(ft.Icons.WIFI_TETHERING, size=16, color=c.TEXT_SECONDARY),
-                    ft.Container(width=Spacing.XS),
-                    ft.Text("Test Connection", color=c.TEXT_PRIMARY),
-                ],
-                tight=True,
+        self.llm_connection_status = self._themed(
+            ft.Text(
+                "",
+                size=Typography.CAPTION_SIZE,
             ),
-            style=ft.ButtonStyle(
-                side=ft.BorderSide(1, c.BORDER_DEFAULT),
-                shape=ft.RoundedRectangleBorder(radius=BorderRadius.SM),
+            color=lambda c: getattr(c, self._llm_status_color),
+        )
+        self.llm_test_button = self._themed(
+            ft.OutlinedButton(
+                content=ft.Row(
+                    [
+                        self._themed(
+                            ft.Icon(ft.Icons.WIFI_TETHERING, size=16),
+                            color="TEXT_SECONDARY",
+                        ),
+                        ft.Container(width=Spacing.XS),
+                        self._themed(ft.Text("Test Connection"), color="TEXT_PRIMARY"),
+                    ],
+                    tight=True,
+                ),
+                on_click=functools.partial(run_task, self._test_llm_connection),
             ),
-            on_click=lambda e: self.app.page.run_task(self._test_llm_connection, e),
+            style=_outlined_button_style,
         )
 
-        self.sidebar = Sidebar(
-            current_route="/settings",
-            newsletters=[],
-            on_navigate=self._handle_navigate,
-            page=self.app.page,
-        )
+        self.sidebar = self.app.get_sidebar("/settings", self._handle_navigate)
+
+        # Sign out confirmation, built on first use and reused afterwards
+        # while the colors it was built with are current
+        self._sign_out_dialog: ConfirmDialog | None = None
+        self._sign_out_dialog_colors = None
+        # Sign out clicked while the dialog was still closing (see _on_sign_out)
+        self._reopen_sign_out_dialog = False
 
         # Theme settings
         self._active_theme = "default.json"
@@ -178,221 +352,263 @@ class SettingsPage(ft.View):
 
         self.controls = [self._build_content()]
 
-        # Load data
-        self.app.page.run_task(self._load_data)
+        # Load data (futures kept so the loads can be cancelled on unmount)
+        self._load_data_task: asyncio.Task | None = None
+        self._sidebar_load_future = None
+        self._load_future = self.app.page.run_task(self._load_data)
+
+    def refresh(self) -> None:
+        """Prepare this (cached) page for another visit.
+
+        Re-attaches the shared sidebar, syncs the appearance dropdown with the
+        page theme mode and reloads data in the background.
+        """
+        self._attach_sidebar()
+        self.theme_dropdown.value = self._theme_mode_value()
+        self._load_future = self.app.page.run_task(self._load_data)
+
+    def will_unmount(self) -> None:
+        """Cancel pending loads when the page leaves the view stack."""
+        for future in (self._load_future, self._sidebar_load_future):
+            if future is not None:
+                future.cancel()
+        super().will_unmount()
+
+    def _themed(self, control: ft.Control, **tokens: _ColorToken) -> ft.Control:
+        """Color a control from the palette and register it for recoloring.
+
+        Args:
+            control: Control (or style holder) to color.
+            **tokens: Property name mapped to a palette attribute name, or to
+                a function building the property value from the palette.
+
+        Returns:
+            The same control, for use inline in builders.
+        """
+        self._apply_tokens(control, tokens)
+        self._themed_controls.append((control, tokens))
+        return control
+
+    def _apply_tokens(self, control: ft.Control, tokens: dict[str, _ColorToken]) -> None:
+        """Set a control's themed properties from the current palette."""
+        c = self.colors
+        for prop, token in tokens.items():
+            setattr(control, prop, token(c) if callable(token) else getattr(c, token))
+
+    def _apply_colors(self) -> None:
+        """Recolor the page in place for the current page theme.
+
+        Updates every registered control and swaps in the parts that hold
+        their own colors (sidebar, theme settings) instead of rebuilding the
+        whole view; the sign out dialog is rebuilt on its next open. The
+        caller pushes the page update.
+        """
+        self.colors = get_colors(self.app.page)
+        for control, tokens in self._themed_controls:
+            self._apply_tokens(control, tokens)
+
+        self._attach_sidebar()
+        self._theme_card.content = self._build_theme_settings()
+
+    def _attach_sidebar(self) -> None:
+        """Place the app's shared sidebar in this page if it changed."""
+        sidebar = self.app.get_sidebar("/settings", self._handle_navigate)
+        if sidebar is not self.sidebar:
+            self.sidebar = sidebar
+            self.controls[0].controls[0] = sidebar
+
+    def _build_sign_out_dialog(self) -> ConfirmDialog:
+        """Build the sign out confirmation dialog for the current colors."""
+        self._sign_out_dialog_colors = self.colors
+        dialog = ConfirmDialog(
+            title="Sign Out",
+            message="Are you sure you want to sign out?",
+            confirm_text="Sign Out",
+            cancel_text="Cancel",
+            is_destructive=True,
+            on_confirm=self._on_confirm_sign_out,
+            on_cancel=self._close_sign_out_dialog,
+            page=self.app.page,
+        )
+        dialog.on_dismiss = self._on_sign_out_dialog_dismiss
+        return dialog
+
+    def _push(self, *controls: ft.Control) -> None:
+        """Send only the given controls' changes to the client.
+
+        Until the view is mounted there is nothing to patch yet, so a batched
+        page update is requested instead.
+
+        Args:
+            *controls: Changed controls.
+        """
+        if not controls:
+            return
+        if self.parent is None:
+            self.app.batch_update()
+        else:
+            self.app.page.update(*controls)
+
+    def _theme_mode_value(self) -> str:
+        """Get the appearance dropdown value for the page theme mode."""
+        return _MODE_TO_STR.get(self.app.page.theme_mode, "system")
 
     def _build_content(self) -> ft.Control:
         """Build page content with sidebar."""
-        c = self.colors  # Shorthand for readability
+        themed = self._themed  # Shorthand for readability
+        section_gap = Spacing.LG
         return ft.Row(
             [
                 # Sidebar
                 self.sidebar,
                 # Main content
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            # Page header
-                            ft.Container(
-                                content=ft.Row(
-                                    [
-                                        ft.IconButton(
-                                            icon=ft.Icons.ARROW_BACK,
-                                            icon_color=c.TEXT_SECONDARY,
-                                            icon_size=20,
-                                            style=ft.ButtonStyle(
-                                                shape=ft.RoundedRectangleBorder(
-                                                    radius=BorderRadius.SM
-                                                ),
+                themed(
+                    ft.Container(
+                        content=ft.Column(
+                            [
+                                # Page header
+                                _make_header(themed, self._navigate_home),
+                                # Settings content
+                                ft.Container(
+                                    content=ft.Column(
+                                        [
+                                            # Account section
+                                            self._build_section(
+                                                "Account",
+                                                self._build_account_content(),
                                             ),
-                                            on_click=lambda _: self.app.navigate(
-                                                "/home"
+                                            ft.Container(height=section_gap),
+                                            # Appearance section
+                                            self._build_section(
+                                                "Appearance",
+                                                self.theme_dropdown,
                                             ),
-                                        ),
-                                        ft.Container(width=Spacing.XS),
-                                        ft.Text(
-                                            "Settings",
-                                            size=Typography.H1_SIZE,
-                                            weight=ft.FontWeight.W_600,
-                                            color=c.TEXT_PRIMARY,
-                                        ),
-                                    ],
-                                ),
-                                padding=ft.padding.only(bottom=Spacing.XL),
-                            ),
-                            # Settings content
-                            ft.Container(
-                                content=ft.Column(
-                                    [
-                                        # Account section
-                                        self._build_section(
-                                            "Account",
-                                            ft.Column(
-                                                [
-                                                    ft.Row(
-                                                        [
-                                                            ft.CircleAvatar(
-                                                                content=ft.Icon(
-                                                                    ft.Icons.PERSON,
-                                                                    size=20,
-                                                                    color=c.TEXT_PRIMARY,
-                                                                ),
-                                                                radius=24,
-                                                                bgcolor=c.BG_TERTIARY,
-                                                            ),
-                                                            ft.Container(width=Spacing.MD),
-                                                            ft.Column(
-                                                                [
-                                                                    ft.Text(
-                                                                        "Google Account",
-                                                                        size=Typography.BODY_SIZE,
-                                                                        weight=ft.FontWeight.W_500,
-                                                                        color=c.TEXT_PRIMARY,
-                                                                    ),
-                                                                    self.user_email_text,
-                                                                ],
-                                                                spacing=Spacing.XXS,
-                                                            ),
-                                                        ],
-                                                    ),
-                                                    ft.Container(height=Spacing.MD),
-                                                    ft.OutlinedButton(
-                                                        content=ft.Row(
-                                                            [
-                                                                ft.Icon(
-                                                                    ft.Icons.LOGOUT,
-                                                                    size=16,
-                                                                    color=c.ERROR,
-                                                                ),
-                                                                ft.Container(
-                                                                    width=Spacing.XS
-                                                                ),
-                                                                ft.Text(
-                                                                    "Sign Out",
-                                                                    color=c.ERROR,
-                                                                ),
-                                                            ],
-                                                        ),
-                                                        style=ft.ButtonStyle(
-                                                            side=ft.BorderSide(
-                                                                1, c.ERROR
-                                                            ),
-                                                            shape=ft.RoundedRectangleBorder(
-                                                                radius=BorderRadius.SM
-                                                            ),
-                                                        ),
-                                                        on_click=lambda e: self.app.page.run_task(
-                                                            self._on_sign_out, e
-                                                        ),
-                                                    ),
-                                                ],
+                                            ft.Container(height=section_gap),
+                                            # Themes section
+                                            self._build_theme_section(),
+                                            ft.Container(height=section_gap),
+                                            # AI Summarization section
+                                            self._build_section(
+                                                "AI Summarization",
+                                                self._build_llm_settings(),
                                             ),
-                                        ),
-                                        ft.Container(height=Spacing.LG),
-                                        # Appearance section
-                                        self._build_section(
-                                            "Appearance",
-                                            self.theme_dropdown,
-                                        ),
-                                        ft.Container(height=Spacing.LG),
-                                        # Themes section
-                                        self._build_theme_section(),
-                                        ft.Container(height=Spacing.LG),
-                                        # AI Summarization section
-                                        self._build_section(
-                                            "AI Summarization",
-                                            self._build_llm_settings(),
-                                        ),
-                                        ft.Container(height=Spacing.LG),
-                                        # About section
-                                        self._build_section(
-                                            "About",
-                                            ft.Column(
-                                                [
-                                                    ft.Row(
-                                                        [
-                                                            ft.Icon(
-                                                                ft.Icons.MARK_EMAIL_READ,
-                                                                size=20,
-                                                                color=c.ACCENT,
-                                                            ),
-                                                            ft.Container(width=Spacing.XS),
-                                                            ft.Text(
-                                                                "Mr Newsletter",
-                                                                size=Typography.BODY_SIZE,
-                                                                weight=ft.FontWeight.W_500,
-                                                                color=c.TEXT_PRIMARY,
-                                                            ),
-                                                        ],
-                                                    ),
-                                                    ft.Container(height=Spacing.XS),
-                                                    ft.Text(
-                                                        "Version 0.1.0",
-                                                        size=Typography.CAPTION_SIZE,
-                                                        color=c.TEXT_TERTIARY,
-                                                        font_family="monospace",
-                                                    ),
-                                                    ft.Container(height=Spacing.SM),
-                                                    ft.Text(
-                                                        "A newsletter reader with Gmail.",
-                                                        size=Typography.BODY_SMALL_SIZE,
-                                                        color=c.TEXT_SECONDARY,
-                                                    ),
-                                                ],
-                                                spacing=0,
+                                            ft.Container(height=section_gap),
+                                            # About section
+                                            self._build_section(
+                                                "About",
+                                                _make_about_section(themed),
                                             ),
-                                        ),
-                                    ],
-                                    scroll=ft.ScrollMode.AUTO,
+                                        ],
+                                        scroll=ft.ScrollMode.AUTO,
+                                    ),
+                                    expand=True,
                                 ),
-                                expand=True,
-                            ),
-                        ],
+                            ],
+                            expand=True,
+                        ),
+                        padding=section_gap,
                         expand=True,
                     ),
-                    padding=Spacing.LG,
-                    expand=True,
-                    bgcolor=c.BG_SECONDARY,
+                    bgcolor="BG_SECONDARY",
                 ),
             ],
             expand=True,
             spacing=0,
         )
 
+    def _build_account_content(self) -> ft.Control:
+        """Build the account section content."""
+        themed = self._themed
+        md = Spacing.MD
+        return ft.Column(
+            [
+                ft.Row(
+                    [
+                        themed(
+                            ft.CircleAvatar(
+                                content=themed(
+                                    ft.Icon(ft.Icons.PERSON, size=20),
+                                    color="TEXT_PRIMARY",
+                                ),
+                                radius=24,
+                            ),
+                            bgcolor="BG_TERTIARY",
+                        ),
+                        ft.Container(width=md),
+                        ft.Column(
+                            [
+                                themed(
+                                    ft.Text(
+                                        "Google Account",
+                                        size=Typography.BODY_SIZE,
+                                        weight=ft.FontWeight.W_500,
+                                    ),
+                                    color="TEXT_PRIMARY",
+                                ),
+                                self.user_email_text,
+                            ],
+                            spacing=Spacing.XXS,
+                        ),
+                    ],
+                ),
+                ft.Container(height=md),
+                themed(
+                    ft.OutlinedButton(
+                        content=ft.Row(
+                            [
+                                themed(
+                                    ft.Icon(ft.Icons.LOGOUT, size=16),
+                                    color="ERROR",
+                                ),
+                                ft.Container(width=Spacing.XS),
+                                themed(ft.Text("Sign Out"), color="ERROR"),
+                            ],
+                        ),
+                        on_click=self._on_sign_out,
+                    ),
+                    style=_sign_out_button_style,
+                ),
+            ],
+        )
+
     def _build_llm_settings(self) -> ft.Control:
         """Build LLM settings content."""
-        c = self.colors
+        themed = self._themed
+        # Bind the repeated token reads once per build
+        sm, md = Spacing.SM, Spacing.MD
+        caption = Typography.CAPTION_SIZE
         return ft.Column(
             [
                 # Enable toggle row
                 ft.Row(
                     [
                         self.llm_enabled_switch,
-                        ft.Container(width=Spacing.SM),
-                        ft.Text(
-                            "Enable AI Summaries",
-                            size=Typography.BODY_SIZE,
-                            color=c.TEXT_PRIMARY,
+                        ft.Container(width=sm),
+                        themed(
+                            ft.Text("Enable AI Summaries", size=Typography.BODY_SIZE),
+                            color="TEXT_PRIMARY",
                         ),
                     ],
                 ),
-                ft.Container(height=Spacing.SM),
-                ft.Text(
-                    "Generate concise summaries of newsletter emails using AI. "
-                    "Works with LM Studio, Ollama, or any OpenAI-compatible API.",
-                    size=Typography.CAPTION_SIZE,
-                    color=c.TEXT_TERTIARY,
+                ft.Container(height=sm),
+                themed(
+                    ft.Text(
+                        "Generate concise summaries of newsletter emails using AI. "
+                        "Works with LM Studio, Ollama, or any OpenAI-compatible API.",
+                        size=caption,
+                    ),
+                    color="TEXT_TERTIARY",
                 ),
-                ft.Container(height=Spacing.MD),
+                ft.Container(height=md),
                 # API Base URL
                 self.llm_api_url_field,
-                ft.Container(height=Spacing.SM),
+                ft.Container(height=sm),
                 # API Key
                 self.llm_api_key_field,
-                ft.Container(height=Spacing.SM),
+                ft.Container(height=sm),
                 # Model name
                 self.llm_model_field,
-                ft.Container(height=Spacing.MD),
+                ft.Container(height=md),
                 # Advanced settings row
                 ft.Row(
                     [
@@ -402,10 +618,9 @@ class SettingsPage(ft.View):
                         # Temperature
                         ft.Column(
                             [
-                                ft.Text(
-                                    "Temperature",
-                                    size=Typography.CAPTION_SIZE,
-                                    color=c.TEXT_SECONDARY,
+                                themed(
+                                    ft.Text("Temperature", size=caption),
+                                    color="TEXT_SECONDARY",
                                 ),
                                 ft.Row(
                                     [
@@ -415,7 +630,7 @@ class SettingsPage(ft.View):
                                         ),
                                         self.llm_temperature_label,
                                     ],
-                                    spacing=Spacing.SM,
+                                    spacing=sm,
                                 ),
                             ],
                             spacing=Spacing.XXS,
@@ -423,12 +638,12 @@ class SettingsPage(ft.View):
                     ],
                     vertical_alignment=ft.CrossAxisAlignment.END,
                 ),
-                ft.Container(height=Spacing.MD),
+                ft.Container(height=md),
                 # Test connection row
                 ft.Row(
                     [
                         self.llm_test_button,
-                        ft.Container(width=Spacing.MD),
+                        ft.Container(width=md),
                         self.llm_connection_status,
                     ],
                     vertical_alignment=ft.CrossAxisAlignment.CENTER,
@@ -439,62 +654,57 @@ class SettingsPage(ft.View):
 
     def _build_section(self, title: str, content: ft.Control) -> ft.Control:
         """Build a settings section with title and card."""
-        c = self.colors
         return ft.Column(
             [
-                ft.Text(
-                    title.upper(),
-                    size=11,
-                    weight=ft.FontWeight.W_500,
-                    color=c.TEXT_TERTIARY,
-                ),
+                self._build_section_title(title),
                 ft.Container(height=Spacing.SM),
-                ft.Container(
-                    content=content,
-                    padding=Spacing.MD,
-                    border_radius=BorderRadius.MD,
-                    border=ft.border.all(1, c.BORDER_DEFAULT),
-                    bgcolor=c.BG_PRIMARY,
-                ),
+                self._build_section_card(content),
             ],
             spacing=0,
         )
 
-    def _build_theme_section(self) -> ft.Control:
-        """Build the themes section with theme settings component."""
-        c = self.colors
+    def _build_section_title(self, title: str) -> ft.Control:
+        """Build a section title."""
+        return self._themed(
+            ft.Text(title.upper(), size=11, weight=ft.FontWeight.W_500),
+            color="TEXT_TERTIARY",
+        )
 
-        # Create theme settings (will be updated when data loads)
-        self.theme_settings = ThemeSettings(
-            flet_page=self.app.page,
-            active_theme=self._active_theme,
-            on_theme_change=lambda filename: self.app.page.run_task(
-                self._on_theme_change, filename
+    def _build_section_card(self, content: ft.Control) -> ft.Container:
+        """Build the bordered card holding a section's content."""
+        return self._themed(
+            ft.Container(
+                content=content,
+                padding=Spacing.MD,
+                border_radius=BorderRadius.MD,
             ),
-            on_import=self._trigger_theme_import,
-            on_export=self._trigger_theme_export,
+            border=_card_border,
+            bgcolor="BG_PRIMARY",
         )
 
+    def _build_theme_section(self) -> ft.Control:
+        """Build the themes section with theme settings component."""
+        self._theme_card = self._build_section_card(self._build_theme_settings())
         return ft.Column(
             [
-                ft.Text(
-                    "THEMES",
-                    size=11,
-                    weight=ft.FontWeight.W_500,
-                    color=c.TEXT_TERTIARY,
-                ),
+                self._build_section_title("Themes"),
                 ft.Container(height=Spacing.SM),
-                ft.Container(
-                    content=self.theme_settings,
-                    padding=Spacing.MD,
-                    border_radius=BorderRadius.MD,
-                    border=ft.border.all(1, c.BORDER_DEFAULT),
-                    bgcolor=c.BG_PRIMARY,
-                ),
+                self._theme_card,
             ],
             spacing=0,
         )
 
+    def _build_theme_settings(self) -> ThemeSettings:
+        """Create the theme settings component (updated when data loads)."""
+        self.theme_settings = ThemeSettings(
+            flet_page=self.app.page,
+            active_theme=self._active_theme,
+            on_theme_change=self._schedule_theme_change,
+            on_import=self._trigger_theme_import,
+            on_export=self._trigger_theme_export,
+        )
+        return self.theme_settings
+
     def _trigger_theme_import(self) -> None:
         """Trigger the theme import file picker."""
         # Use run_task to call the async handler
@@ -507,11 +717,6 @@ class SettingsPage(ft.View):
         - Desktop: Uses file.path directly
         - Web: Uploads file to server temp storage, then reads from there
         """
-        import asyncio
-        import uuid
-
-        from src.config.settings import get_settings
-
         logger.debug(f"Theme import started - page.web={self.app.page.web}")
 
         try:
@@ -723,6 +928,7 @@ class SettingsPage(ft.View):
             async with self.app.get_session() as session:
                 settings_repo = UserSettingsRepository(session)
                 await settings_repo.update_active_theme(theme_filename)
+                await settings_repo.update_theme_mode(self.app.page.theme_mode.value)
                 await session.commit()
 
             # Update local state
@@ -731,16 +937,13 @@ class SettingsPage(ft.View):
                 self.theme_settings.update_active_theme(theme_filename)
 
             # Update page themes for Flet
-            from src.ui.themes.app_theme import AppTheme
             self.app.page.theme = AppTheme.create_theme_from_colors(light_colors)
             self.app.page.dark_theme = AppTheme.create_theme_from_colors(dark_colors, is_dark=True)
 
             self.app.show_snackbar(f"Theme '{theme.metadata.name}' applied")
 
-            # Recreate page to apply new colors
-            self.app.page.views.clear()
-            from src.ui.pages.settings_page import SettingsPage
-            self.app.page.views.append(SettingsPage(self.app))
+            # Recolor the page in place with the new palette
+            self._apply_colors()
             self.app.page.update()
 
         except Exception as ex:
@@ -750,90 +953,173 @@ class SettingsPage(ft.View):
         """Handle navigation from sidebar."""
         self.app.navigate(route)
 
+    def _navigate_home(self, _: ft.ControlEvent) -> None:
+        """Handle the header back button."""
+        self.app.navigate("/home")
+
+    def _schedule_theme_change(self, theme_filename: str) -> None:
+        """Handle theme selection from the theme settings component."""
+        self.app.page.run_task(self._on_theme_change, theme_filename)
+
     async def _load_data(self) -> None:
-        """Load user information, newsletters, and LLM settings."""
+        """Load user information and LLM settings, then sidebar newsletters.
+
+        The user and settings loads are independent, so they run concurrently,
+        each in its own session (a single AsyncSession is not safe for
+        concurrent use). Newsletters are scheduled once the page is usable.
+        """
+        # Coalesce overlapping loads (e.g. fast re-entry of /settings)
+        pending = self._load_data_task
+        if pending is not None and not pending.done():
+            await pending
+            return
+
+        self._load_data_task = asyncio.current_task()
+        try:
+            email_text, changed = await asyncio.gather(
+                self._load_user_email(),
+                self._load_user_settings(),
+            )
+            # Push only the controls a reload actually changed
+            if _set_value(self.user_email_text, email_text):
+                changed.append(self.user_email_text)
+            self._push(*changed)
+
+            # Sidebar newsletters are not needed to use the page, load them after
+            self._sidebar_load_future = self.app.page.run_task(
+                self._load_sidebar_newsletters
+            )
+        except asyncio.CancelledError:
+            # Page was left before the load finished; don't touch stale UI
+            raise
+        except Exception:
+            if _set_value(self.user_email_text, "Error loading data"):
+                self._push(self.user_email_text)
+        finally:
+            self._load_data_task = None
+
+    async def _load_user_email(self) -> str:
+        """Load the signed-in user's email.
+
+        Returns:
+            Text to show in the account section.
+        """
+        email = self.app.get_cached_user_email()
+        if email:
+            return email
         try:
             async with self.app.get_session() as session:
-                # Load user info
-                try:
-                    auth_service = AuthService(session)
-                    email = await auth_service.get_current_user_email()
-                    self.user_email_text.value = email or "Not signed in"
-                except Exception:
-                    self.user_email_text.value = "Error loading user info"
+                auth_service = AuthService(session)
+                email = await auth_service.get_current_user_email()
+            if not email:
+                return "Not signed in"
+            self.app.cache_user_email(email)
+            return email
+        except Exception:
+            return "Error loading user info"
 
-                # Load newsletters for sidebar
-                try:
-                    newsletter_service = NewsletterService(session=session)
-                    self.newsletters = await newsletter_service.get_all_newsletters()
-                except Exception:
-                    self.newsletters = []
+    async def _load_sidebar_newsletters(self) -> None:
+        """Load newsletters into the sidebar in the background."""
+        self.newsletters = await self._load_newsletters()
+        self.sidebar.update_newsletters(self.newsletters)
 
-                # Load user settings
-                try:
-                    settings_repo = UserSettingsRepository(session)
-                    user_settings = await settings_repo.get_settings()
+    async def _load_newsletters(self) -> list:
+        """Load newsletters for the sidebar.
 
-                    # Load active theme first (most important for visual consistency)
-                    self._active_theme = user_settings.active_theme or "default.json"
-                    if self.theme_settings:
-                        self.theme_settings.update_active_theme(self._active_theme)
-                except Exception as ex:
-                    import logging
-                    logging.getLogger(__name__).warning(f"Error loading theme settings: {ex}")
-                    user_settings = None
+        Returns:
+            List of newsletters, empty on error.
+        """
+        newsletters = self.app.get_cached_newsletters()
+        if newsletters is not None:
+            return newsletters
+        try:
+            async with self.app.get_session() as session:
+                newsletter_service = NewsletterService(session=session)
+                newsletters = await newsletter_service.get_all_newsletters()
+            self.app.cache_newsletters(newsletters)
+            return newsletters
+        except Exception:
+            return []
+
+    async def _load_user_settings(self) -> list[ft.Control]:
+        """Load theme and LLM settings into the page state and controls.
+
+        Returns:
+            LLM controls whose values changed and need pushing.
+        """
+        changed = []
+        try:
+            async with self.app.get_session() as session:
+                settings_repo = UserSettingsRepository(session)
+                user_settings = await settings_repo.get_settings()
+
+                # Load active theme first (most important for visual consistency)
+                self._active_theme = user_settings.active_theme or "default.json"
+                if self.theme_settings:
+                    self.theme_settings.update_active_theme(self._active_theme)
 
                 # Update LLM UI with loaded settings
-                if user_settings:
-                    try:
-                        self._llm_enabled = user_settings.llm_enabled
-                        self._llm_api_base_url = user_settings.llm_api_base_url or "http://localhost:1234/v1"
-                        self._llm_model = user_settings.llm_model or ""
-                        self._llm_max_tokens = user_settings.llm_max_tokens
-                        self._llm_temperature = user_settings.llm_temperature
-                        self._llm_has_api_key = bool(user_settings.llm_api_key_encrypted)
-
-                        # Update UI controls
-                        self.llm_enabled_switch.value = self._llm_enabled
-                        self.llm_api_url_field.value = self._llm_api_base_url
-                        self.llm_model_field.value = self._llm_model
-                        self.llm_max_tokens_field.value = str(self._llm_max_tokens)
-                        self.llm_temperature_slider.value = self._llm_temperature
-                        self.llm_temperature_label.value = f"{self._llm_temperature:.1f}"
-
-                        # Show placeholder if API key is set
-                        if self._llm_has_api_key:
-                            self.llm_api_key_field.hint_text = "API key is set (enter new to change)"
-                    except Exception as ex:
-                        import logging
-                        logging.getLogger(__name__).warning(f"Error loading LLM settings: {ex}")
-
-            # Update sidebar
-            self.sidebar.update_newsletters(self.newsletters)
-            self.app.page.update()
-        except Exception:
-            self.user_email_text.value = "Error loading data"
-            self.app.page.update()
+                try:
+                    self._llm_enabled = user_settings.llm_enabled
+                    self._llm_api_base_url = user_settings.llm_api_base_url or "http://localhost:1234/v1"
+                    self._llm_model = user_settings.llm_model or ""
+                    self._llm_max_tokens = user_settings.llm_max_tokens
+                    self._llm_temperature = user_settings.llm_temperature
+                    self._llm_has_api_key = bool(user_settings.llm_api_key_encrypted)
+
+                    # Update UI controls
+                    values = [
+                        (self.llm_enabled_switch, self._llm_enabled),
+                        (self.llm_api_url_field, self._llm_api_base_url),
+                        (self.llm_model_field, self._llm_model),
+                        (self.llm_max_tokens_field, str(self._llm_max_tokens)),
+                        (self.llm_temperature_slider, self._llm_temperature),
+                        (self.llm_temperature_label, f"{self._llm_temperature:.1f}"),
+                    ]
+                    changed.extend(
+                        control for control, value in values if _set_value(control, value)
+                    )
+
+                    # Show placeholder if API key is set
+                    if self._llm_has_api_key and _set_value(
+                        self.llm_api_key_field,
+                        "API key is set (enter new to change)",
+                        attr="hint_text",
+                    ):
+                        changed.append(self.llm_api_key_field)
+                except Exception as ex:
+                    logger.warning(f"Error loading LLM settings: {ex}")
+        except Exception as ex:
+            logger.warning(f"Error loading theme settings: {ex}")
+        return changed
 
     def _on_appearance_mode_change(self, e: ft.ControlEvent) -> None:
         """Handle appearance mode (light/dark/system) change."""
         # Use e.data which contains the selected option key in on_select events
         theme_value = e.data or self.theme_dropdown.value
-        if theme_value == "light":
-            self.app.page.theme_mode = ft.ThemeMode.LIGHT
-        elif theme_value == "dark":
-            self.app.page.theme_mode = ft.ThemeMode.DARK
-        else:
-            self.app.page.theme_mode = ft.ThemeMode.SYSTEM
-        self.app.page.update()
+        theme_mode = _STR_TO_MODE.get(theme_value, ft.ThemeMode.SYSTEM)
+
+        # Re-selecting the current mode needs no re-theme or rebuild
+        if theme_mode == self.app.page.theme_mode:
+            return
+
+        self.app.page.theme_mode = theme_mode
+        self.app.page.run_task(self._save_theme_mode, theme_mode.value)
 
-        # Force page recreation by navigating away then back
-        # This is needed because same-route navigation doesn't trigger route change
-        self.app.page.views.clear()
-        from src.ui.pages.settings_page import SettingsPage
-        self.app.page.views.append(SettingsPage(self.app))
+        # Recolor the page in place and push a single update
+        self._apply_colors()
         self.app.page.update()
 
+    async def _save_theme_mode(self, theme_mode: str) -> None:
+        """Persist the appearance mode so it is restored on next start."""
+        try:
+            async with self.app.get_session() as session:
+                settings_repo = UserSettingsRepository(session)
+                await settings_repo.update_theme_mode(theme_mode)
+                await session.commit()
+        except Exception as ex:
+            logger.warning(f"Error saving appearance mode: {ex}")
+
     async def _on_llm_toggle(self, e: ft.ControlEvent) -> None:
         """Handle LLM enabled toggle."""
         try:
@@ -846,15 +1132,28 @@ class SettingsPage(ft.View):
             self.app.show_snackbar(f"Error saving setting: {ex}", error=True)
             # Revert switch
             e.control.value = self._llm_enabled
-            self.app.page.update()
+            self._push(e.control)
 
     async def _on_llm_url_change(self, e: ft.ControlEvent) -> None:
-        """Handle API URL change."""
-        url = e.control.value.strip()
+        """Handle API URL change.
+
+        Malformed URLs are rejected, and unchanged ones skipped, without
+        opening a database session.
+        """
+        url = (e.control.value or "").strip()
         if not url:
             url = "http://localhost:1234/v1"
             e.control.value = url
-            self.app.page.update()
+            self._push(e.control)
+        elif not _LLM_URL_RE.match(url):
+            self.app.show_snackbar(
+                "API Base URL must start with http:// or https://", error=True
+            )
+            e.control.value = self._llm_api_base_url
+            self._push(e.control)
+            return
+        if url == self._llm_api_base_url:
+            return
 
         try:
             async with self.app.get_session() as session:
@@ -879,14 +1178,16 @@ class SettingsPage(ft.View):
                 self._llm_has_api_key = True
                 e.control.value = ""  # Clear the field for security
                 e.control.hint_text = "API key is set (enter new to change)"
-                self.app.page.update()
+                self._push(e.control)
                 self.app.show_snackbar("API key saved")
         except Exception as ex:
             self.app.show_snackbar(f"Error saving API key: {ex}", error=True)
 
     async def _on_llm_model_change(self, e: ft.ControlEvent) -> None:
         """Handle model name change."""
-        model = e.control.value.strip()
+        model = (e.control.value or "").strip()
+        if model == self._llm_model:
+            return
         try:
             async with self.app.get_session() as session:
                 settings_repo = UserSettingsRepository(session)
@@ -899,13 +1200,15 @@ class SettingsPage(ft.View):
     async def _on_max_tokens_change(self, e: ft.ControlEvent) -> None:
         """Handle max tokens change."""
         try:
-            max_tokens = int(e.control.value)
+            max_tokens = int(e.control.value or "")
             if max_tokens < 50:
                 max_tokens = 50
             elif max_tokens > 4000:
                 max_tokens = 4000
             e.control.value = str(max_tokens)
-            self.app.page.update()
+            self._push(e.control)
+            if max_tokens == self._llm_max_tokens:
+                return
 
             async with self.app.get_session() as session:
                 settings_repo = UserSettingsRepository(session)
@@ -914,7 +1217,7 @@ class SettingsPage(ft.View):
                 self._llm_max_tokens = max_tokens
         except ValueError:
             e.control.value = str(self._llm_max_tokens)
-            self.app.page.update()
+            self._push(e.control)
         except Exception as ex:
             self.app.show_snackbar(f"Error saving setting: {ex}", error=True)
 
@@ -922,7 +1225,7 @@ class SettingsPage(ft.View):
         """Handle temperature slider change."""
         temperature = round(e.control.value, 1)
         self.llm_temperature_label.value = f"{temperature:.1f}"
-        self.app.page.update()
+        self._push(self.llm_temperature_label)
 
         try:
             async with self.app.get_session() as session:
@@ -935,10 +1238,8 @@ class SettingsPage(ft.View):
 
     async def _test_llm_connection(self, e: ft.ControlEvent) -> None:
         """Test connection to LLM API."""
-        c = self.colors
-        self.llm_connection_status.value = "Testing..."
-        self.llm_connection_status.color = c.TEXT_TERTIARY
-        self.app.page.update()
+        self._set_llm_status("Testing...", "TEXT_TERTIARY")
+        self._push(self.llm_connection_status)
 
         try:
             # Get current settings from database
@@ -950,49 +1251,68 @@ class SettingsPage(ft.View):
             llm_service = LLMService(user_settings=user_settings)
             success, message = await llm_service.check_connection()
 
-            if success:
-                self.llm_connection_status.value = message
-                self.llm_connection_status.color = c.SUCCESS
-            else:
-                self.llm_connection_status.value = message
-                self.llm_connection_status.color = c.ERROR
+            self._set_llm_status(message, "SUCCESS" if success else "ERROR")
 
         except Exception as ex:
-            self.llm_connection_status.value = f"Error: {ex}"
-            self.llm_connection_status.color = c.ERROR
+            self._set_llm_status(f"Error: {ex}", "ERROR")
 
-        self.app.page.update()
+        self._push(self.llm_connection_status)
 
-    async def _on_sign_out(self, e: ft.ControlEvent) -> None:
-        """Handle sign out."""
-
-        async def confirm_sign_out(e: ft.ControlEvent) -> None:
-            try:
-                async with self.app.get_session() as session:
-                    auth_service = AuthService(session)
-                    await auth_service.logout()
-
-                self.app.gmail_service = None
-                dialog.open = False
-                self.app.page.update()
-                self.app.show_snackbar("Signed out successfully")
-                self.app.navigate("/login")
-            except Exception as ex:
-                self.app.show_snackbar(f"Error: {ex}", error=True)
-
-        def close_dialog(_: ft.ControlEvent | None) -> None:
-            dialog.open = False
-            self.app.page.update()
+    def _set_llm_status(self, message: str, color: str) -> None:
+        """Show a connection status message.
 
-        dialog = ConfirmDialog(
-            title="Sign Out",
-            message="Are you sure you want to sign out?",
-            confirm_text="Sign Out",
-            cancel_text="Cancel",
-            is_destructive=True,
-            on_confirm=lambda e: self.app.page.run_task(confirm_sign_out, e),
-            on_cancel=close_dialog,
-            page=self.app.page,
-        )
+        Args:
+            message: Status text.
+            color: Palette attribute to color it with (kept across recoloring).
+        """
+        self._llm_status_color = color
+        self.llm_connection_status.value = message
+        self.llm_connection_status.color = getattr(self.colors, color)
+
+    def _on_sign_out(self, e: ft.ControlEvent) -> None:
+        """Handle sign out by asking for confirmation.
+
+        Showing the dialog is synchronous, so the button calls this directly
+        rather than scheduling it with run_task.
+        """
+        dialog = self._sign_out_dialog
+        if dialog is not None and dialog.open:
+            return
+        if dialog is None or self._sign_out_dialog_colors is not self.colors:
+            dialog = self._sign_out_dialog = self._build_sign_out_dialog()
+        try:
+            self.app.page.show_dialog(dialog)
+        except RuntimeError:
+            # Flet keeps a closed dialog on its stack until the client reports
+            # the dismissal and refuses to show it (or an equal one) before
+            # that, so show it again once the dismissal arrives
+            self._reopen_sign_out_dialog = True
+
+    def _on_sign_out_dialog_dismiss(self, e: ft.ControlEvent) -> None:
+        """Reopen the sign out dialog if Sign Out was clicked while it closed."""
+        if self._reopen_sign_out_dialog:
+            self._reopen_sign_out_dialog = False
+            self._on_sign_out(e)
+
+    def _on_confirm_sign_out(self, e: ft.ControlEvent) -> None:
+        """Handle sign out confirmation."""
+        self.app.page.run_task(self._confirm_sign_out, e)
+
+    async def _confirm_sign_out(self, e: ft.ControlEvent) -> None:
+        """Sign out and go back to the login page."""
+        try:
+            async with self.app.get_session() as session:
+                auth_service = AuthService(session)
+                await auth_service.logout()
+
+            self.app.gmail_service = None
+            self.app.invalidate_session_cache()
+            self.app.page.pop_dialog()
+            self.app.show_snackbar("Signed out successfully")
+            self.app.navigate("/login")
+        except Exception as ex:
+            self.app.show_snackbar(f"Error: {ex}", error=True)
 
-        self.app.page.show_dialog(dialog)
+    def _close_sign_out_dialog(self, e: ft.ControlEvent | None) -> None:
+        """Close the sign out dialog without signing out."""
+        self.app.page.pop_dialog()
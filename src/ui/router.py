@@ -1,11 +1,24 @@
 """UI Router for page navigation."""
 
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.app import NewsletterApp
 
 
+@functools.lru_cache(maxsize=256)
+def _newsletter_route(newsletter_id: int) -> str:
+    """Get the email list route for a newsletter (cached per ID)."""
+    return f"/newsletter/{newsletter_id}"
+
+
+@functools.lru_cache(maxsize=256)
+def _email_route(email_id: int) -> str:
+    """Get the reader route for an email (cached per ID)."""
+    return f"/email/{email_id}"
+
+
 class Router:
     """Router for handling page navigation."""
 
@@ -47,7 +60,7 @@ class Router:
         Args:
             newsletter_id: Newsletter ID.
         """
-        self.navigate(f"/newsletter/{newsletter_id}")
+        self.navigate(_newsletter_route(newsletter_id))
 
     def go_email(self, email_id: int) -> None:
         """Navigate to email reader.
@@ -55,7 +68,7 @@ class Router:
         Args:
             email_id: Email ID.
         """
-        self.navigate(f"/email/{email_id}")
+        self.navigate(_email_route(email_id))
 
     def go_settings(self) -> None:
         """Navigate to settings page."""
@@ -1,16 +1,63 @@
 """Application theme configuration using design tokens."""
 
+import functools
 from typing import Type
 
 import flet as ft
 
 from .design_tokens import Colors, Typography
 
+# Typography is the same in every theme, so all themes share one TextTheme.
+# It is never mutated after creation.
+_TEXT_THEME = ft.TextTheme(
+    headline_large=ft.TextStyle(
+        size=Typography.H1_SIZE,
+        weight=ft.FontWeight.W_600,
+    ),
+    headline_medium=ft.TextStyle(
+        size=Typography.H2_SIZE,
+        weight=ft.FontWeight.W_600,
+    ),
+    headline_small=ft.TextStyle(
+        size=Typography.H3_SIZE,
+        weight=ft.FontWeight.W_600,
+    ),
+    title_large=ft.TextStyle(
+        size=Typography.H4_SIZE,
+        weight=ft.FontWeight.W_500,
+    ),
+    title_medium=ft.TextStyle(
+        size=Typography.BODY_SIZE,
+        weight=ft.FontWeight.W_500,
+    ),
+    body_large=ft.TextStyle(
+        size=Typography.BODY_SIZE,
+        weight=ft.FontWeight.W_400,
+    ),
+    body_medium=ft.TextStyle(
+        size=Typography.BODY_SMALL_SIZE,
+        weight=ft.FontWeight.W_400,
+    ),
+    label_large=ft.TextStyle(
+        size=Typography.CAPTION_SIZE,
+        weight=ft.FontWeight.W_500,
+    ),
+    label_medium=ft.TextStyle(
+        size=Typography.CAPTION_SIZE,
+        weight=ft.FontWeight.W_400,
+    ),
+)
+
 
 class AppTheme:
-    """Application theme with design token integration."""
+    """Application theme with design token integration.
+
+    Built themes are cached: they depend only on the design tokens and
+    colors they are given, and are never mutated after creation.
+    """
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_light_theme() -> ft.Theme:
         """Get light theme configuration."""
         c = Colors.Light
@@ -33,47 +80,11 @@ class AppTheme:
                 error=c.ERROR,
                 on_error="#FFFFFF",
             ),
-            text_theme=ft.TextTheme(
-                headline_large=ft.TextStyle(
-                    size=Typography.H1_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                headline_medium=ft.TextStyle(
-                    size=Typography.H2_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                headline_small=ft.TextStyle(
-                    size=Typography.H3_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                title_large=ft.TextStyle(
-                    size=Typography.H4_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                title_medium=ft.TextStyle(
-                    size=Typography.BODY_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                body_large=ft.TextStyle(
-                    size=Typography.BODY_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-                body_medium=ft.TextStyle(
-                    size=Typography.BODY_SMALL_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-                label_large=ft.TextStyle(
-                    size=Typography.CAPTION_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                label_medium=ft.TextStyle(
-                    size=Typography.CAPTION_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-            ),
+            text_theme=_TEXT_THEME,
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_dark_theme() -> ft.Theme:
         """Get dark theme configuration."""
         c = Colors.Dark
@@ -96,47 +107,11 @@ class AppTheme:
                 error=c.ERROR,
                 on_error=c.BG_PRIMARY,
             ),
-            text_theme=ft.TextTheme(
-                headline_large=ft.TextStyle(
-                    size=Typography.H1_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                headline_medium=ft.TextStyle(
-                    size=Typography.H2_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                headline_small=ft.TextStyle(
-                    size=Typography.H3_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                title_large=ft.TextStyle(
-                    size=Typography.H4_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                title_medium=ft.TextStyle(
-                    size=Typography.BODY_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                body_large=ft.TextStyle(
-                    size=Typography.BODY_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-                body_medium=ft.TextStyle(
-                    size=Typography.BODY_SMALL_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-                label_large=ft.TextStyle(
-                    size=Typography.CAPTION_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                label_medium=ft.TextStyle(
-                    size=Typography.CAPTION_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-            ),
+            text_theme=_TEXT_THEME,
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def create_theme_from_colors(colors_class: Type, is_dark: bool = False) -> ft.Theme:
         """Create a Flet theme from a dynamic colors class.
 
@@ -170,47 +145,17 @@ class AppTheme:
                 error=c.ERROR,
                 on_error=on_error,
             ),
-            text_theme=ft.TextTheme(
-                headline_large=ft.TextStyle(
-                    size=Typography.H1_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                headline_medium=ft.TextStyle(
-                    size=Typography.H2_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                headline_small=ft.TextStyle(
-                    size=Typography.H3_SIZE,
-                    weight=ft.FontWeight.W_600,
-                ),
-                title_large=ft.TextStyle(
-                    size=Typography.H4_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                title_medium=ft.TextStyle(
-                    size=Typography.BODY_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                body_large=ft.TextStyle(
-                    size=Typography.BODY_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-                body_medium=ft.TextStyle(
-                    size=Typography.BODY_SMALL_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-                label_large=ft.TextStyle(
-                    size=Typography.CAPTION_SIZE,
-                    weight=ft.FontWeight.W_500,
-                ),
-                label_medium=ft.TextStyle(
-                    size=Typography.CAPTION_SIZE,
-                    weight=ft.FontWeight.W_400,
-                ),
-            ),
+            text_theme=_TEXT_THEME,
         )
 
 
+# Theme mode -> cached theme getter
+_THEME_GETTERS = {
+    "light": AppTheme.get_light_theme,
+    "dark": AppTheme.get_dark_theme,
+}
+
+
 def get_theme(mode: str = "light") -> ft.Theme:
     """Get theme by mode.
 
@@ -220,6 +165,4 @@ def get_theme(mode: str = "light") -> ft.Theme:
     Returns:
         Theme configuration.
     """
-    if mode == "dark":
-        return AppTheme.get_dark_theme()
-    return AppTheme.get_light_theme()
+    return _THEME_GETTERS.get(mode, AppTheme.get_light_theme)()
@@ -2,46 +2,102 @@
 
 This module contains all built-in themes for the Newsletter Reader application.
 Each theme is defined in its own file and exported here for use by ThemeService.
+
+Theme modules are imported lazily: a theme dict is only loaded when it is
+first accessed, either as a module attribute or through ALL_BUILTIN_THEMES.
 """
 
-from .catppuccin import CATPPUCCIN_LATTE_THEME, CATPPUCCIN_MOCHA_THEME
-from .dark_slate import DARK_SLATE_THEME
-from .default import DEFAULT_THEME
-from .dracula import DRACULA_THEME
-from .gruvbox import GRUVBOX_DARK_THEME, GRUVBOX_LIGHT_THEME
-from .light_clean import LIGHT_CLEAN_THEME
-from .liquid_glass import LIQUID_GLASS_THEME
-from .midnight import MIDNIGHT_THEME
-from .nord import NORD_THEME
-from .one_dark import ONE_DARK_THEME
-from .solarized import SOLARIZED_DARK_THEME, SOLARIZED_LIGHT_THEME
-from .tokyo_night import TOKYO_NIGHT_THEME
+import importlib
+from collections.abc import Iterator, Mapping
 
-# Mapping of filename to theme data dictionary
-# This is used by ThemeService to create theme files
-ALL_BUILTIN_THEMES: dict[str, dict] = {
+# Exported theme name -> defining submodule
+_THEME_MODULES: dict[str, str] = {
+    "DEFAULT_THEME": "default",
+    "DARK_SLATE_THEME": "dark_slate",
+    "LIGHT_CLEAN_THEME": "light_clean",
+    "MIDNIGHT_THEME": "midnight",
+    "NORD_THEME": "nord",
+    "SOLARIZED_LIGHT_THEME": "solarized",
+    "SOLARIZED_DARK_THEME": "solarized",
+    "DRACULA_THEME": "dracula",
+    "GRUVBOX_LIGHT_THEME": "gruvbox",
+    "GRUVBOX_DARK_THEME": "gruvbox",
+    "CATPPUCCIN_LATTE_THEME": "catppuccin",
+    "CATPPUCCIN_MOCHA_THEME": "catppuccin",
+    "ONE_DARK_THEME": "one_dark",
+    "TOKYO_NIGHT_THEME": "tokyo_night",
+    "LIQUID_GLASS_THEME": "liquid_glass",
+}
+
+# Theme filename -> exported theme name
+_THEME_FILES: dict[str, str] = {
     # Original themes
-    "default.json": DEFAULT_THEME,
-    "dark-slate.json": DARK_SLATE_THEME,
-    "light-clean.json": LIGHT_CLEAN_THEME,
-    "midnight.json": MIDNIGHT_THEME,
+    "default.json": "DEFAULT_THEME",
+    "dark-slate.json": "DARK_SLATE_THEME",
+    "light-clean.json": "LIGHT_CLEAN_THEME",
+    "midnight.json": "MIDNIGHT_THEME",
     # Popular color schemes
-    "nord.json": NORD_THEME,
-    "solarized-light.json": SOLARIZED_LIGHT_THEME,
-    "solarized-dark.json": SOLARIZED_DARK_THEME,
-    "dracula.json": DRACULA_THEME,
-    "gruvbox-light.json": GRUVBOX_LIGHT_THEME,
-    "gruvbox-dark.json": GRUVBOX_DARK_THEME,
-    "catppuccin-latte.json": CATPPUCCIN_LATTE_THEME,
-    "catppuccin-mocha.json": CATPPUCCIN_MOCHA_THEME,
-    "one-dark.json": ONE_DARK_THEME,
-    "tokyo-night.json": TOKYO_NIGHT_THEME,
+    "nord.json": "NORD_THEME",
+    "solarized-light.json": "SOLARIZED_LIGHT_THEME",
+    "solarized-dark.json": "SOLARIZED_DARK_THEME",
+    "dracula.json": "DRACULA_THEME",
+    "gruvbox-light.json": "GRUVBOX_LIGHT_THEME",
+    "gruvbox-dark.json": "GRUVBOX_DARK_THEME",
+    "catppuccin-latte.json": "CATPPUCCIN_LATTE_THEME",
+    "catppuccin-mocha.json": "CATPPUCCIN_MOCHA_THEME",
+    "one-dark.json": "ONE_DARK_THEME",
+    "tokyo-night.json": "TOKYO_NIGHT_THEME",
     # Glass effects
-    "liquid-glass.json": LIQUID_GLASS_THEME,
+    "liquid-glass.json": "LIQUID_GLASS_THEME",
 }
 
+# Built-in theme filenames, for membership tests without loading any theme
+BUILTIN_THEME_FILES: frozenset[str] = frozenset(_THEME_FILES)
+
+
+def __getattr__(name: str) -> dict:
+    """Import a theme's module on first access and cache the theme."""
+    module_name = _THEME_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    theme = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = theme
+    return theme
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_THEME_MODULES))
+
+
+class _LazyThemes(Mapping):
+    """Read-only filename -> theme mapping that loads themes on lookup."""
+
+    def __getitem__(self, filename: str) -> dict:
+        try:
+            name = _THEME_FILES[filename]
+        except KeyError:
+            raise KeyError(filename) from None
+        if name in globals():
+            return globals()[name]
+        return __getattr__(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_THEME_FILES)
+
+    def __len__(self) -> int:
+        return len(_THEME_FILES)
+
+    def __contains__(self, filename: object) -> bool:
+        return filename in _THEME_FILES
+
+
+# Mapping of filename to theme data dictionary
+# This is used by ThemeService to create theme files
+ALL_BUILTIN_THEMES: Mapping[str, dict] = _LazyThemes()
+
 __all__ = [
     "ALL_BUILTIN_THEMES",
+    "BUILTIN_THEME_FILES",
     "DEFAULT_THEME",
     "DARK_SLATE_THEME",
     "LIGHT_CLEAN_THEME",
@@ -26,6 +26,80 @@ Accent colors:
 - green: #859900
 """
 
+# Solarized light palette, the light variant of both themes
+_SOLARIZED_LIGHT_COLORS = {
+    # Light mode - base3/base2 backgrounds
+    "bg_primary": "#FDF6E3",
+    "bg_secondary": "#EEE8D5",
+    "bg_tertiary": "#E4DCC6",
+    "bg_elevated": "#FFFFFF",
+    # Dark bases for text
+    "text_primary": "#073642",
+    "text_secondary": "#586E75",
+    "text_tertiary": "#657B83",
+    "text_disabled": "#93A1A1",
+    # Borders
+    "border_default": "#EEE8D5",
+    "border_subtle": "#F5EED9",
+    "border_strong": "#D8D0B8",
+    # Interactive
+    "hover": "#EEE8D5",
+    "active": "#E4DCC6",
+    "focus_ring": "#268BD2",
+    # Blue accent
+    "accent": "#268BD2",
+    "accent_hover": "#1A6699",
+    "accent_muted": "#E8F4FC",
+    # Semantic
+    "success": "#859900",
+    "success_muted": "#E8EDD0",
+    "warning": "#B58900",
+    "warning_muted": "#F5EDD0",
+    "error": "#DC322F",
+    "error_muted": "#FBEAE9",
+    # Special
+    "unread_dot": "#2AA198",
+    "star_active": "#B58900",
+    "star_inactive": "#93A1A1",
+}
+
+# Solarized dark palette, the dark variant of both themes
+_SOLARIZED_DARK_COLORS = {
+    # Dark mode - base03/base02 backgrounds
+    "bg_primary": "#002B36",
+    "bg_secondary": "#073642",
+    "bg_tertiary": "#0D4652",
+    "bg_elevated": "#073642",
+    # Light bases for text
+    "text_primary": "#FDF6E3",
+    "text_secondary": "#EEE8D5",
+    "text_tertiary": "#93A1A1",
+    "text_disabled": "#586E75",
+    # Borders
+    "border_default": "#073642",
+    "border_subtle": "#002B36",
+    "border_strong": "#0D4652",
+    # Interactive
+    "hover": "#073642",
+    "active": "#0D4652",
+    "focus_ring": "#268BD2",
+    # Blue accent
+    "accent": "#268BD2",
+    "accent_hover": "#3CA0E8",
+    "accent_muted": "#0D3A47",
+    # Semantic
+    "success": "#859900",
+    "success_muted": "#1A3300",
+    "warning": "#B58900",
+    "warning_muted": "#3D2E00",
+    "error": "#DC322F",
+    "error_muted": "#4A1110",
+    # Special
+    "unread_dot": "#2AA198",
+    "star_active": "#B58900",
+    "star_inactive": "#586E75",
+}
+
 SOLARIZED_LIGHT_THEME = {
     "metadata": {
         "name": "Solarized Light",
@@ -35,76 +109,8 @@ SOLARIZED_LIGHT_THEME = {
         "base": "light",
     },
     "colors": {
-        "light": {
-            # Light mode - base3/base2 backgrounds
-            "bg_primary": "#FDF6E3",
-            "bg_secondary": "#EEE8D5",
-            "bg_tertiary": "#E4DCC6",
-            "bg_elevated": "#FFFFFF",
-            # Dark bases for text
-            "text_primary": "#073642",
-            "text_secondary": "#586E75",
-            "text_tertiary": "#657B83",
-            "text_disabled": "#93A1A1",
-            # Borders
-            "border_default": "#EEE8D5",
-            "border_subtle": "#F5EED9",
-            "border_strong": "#D8D0B8",
-            # Interactive
-            "hover": "#EEE8D5",
-            "active": "#E4DCC6",
-            "focus_ring": "#268BD2",
-            # Blue accent
-            "accent": "#268BD2",
-            "accent_hover": "#1A6699",
-            "accent_muted": "#E8F4FC",
-            # Semantic
-            "success": "#859900",
-            "success_muted": "#E8EDD0",
-            "warning": "#B58900",
-            "warning_muted": "#F5EDD0",
-            "error": "#DC322F",
-            "error_muted": "#FBEAE9",
-            # Special
-            "unread_dot": "#2AA198",
-            "star_active": "#B58900",
-            "star_inactive": "#93A1A1",
-        },
-        "dark": {
-            # Dark mode - base03/base02 backgrounds
-            "bg_primary": "#002B36",
-            "bg_secondary": "#073642",
-            "bg_tertiary": "#0D4652",
-            "bg_elevated": "#073642",
-            # Light bases for text
-            "text_primary": "#FDF6E3",
-            "text_secondary": "#EEE8D5",
-            "text_tertiary": "#93A1A1",
-            "text_disabled": "#586E75",
-            # Borders
-            "border_default": "#073642",
-            "border_subtle": "#002B36",
-            "border_strong": "#0D4652",
-            # Interactive
-            "hover": "#073642",
-            "active": "#0D4652",
-            "focus_ring": "#268BD2",
-            # Blue accent
-            "accent": "#268BD2",
-            "accent_hover": "#3CA0E8",
-            "accent_muted": "#0D3A47",
-            # Semantic
-            "success": "#859900",
-            "success_muted": "#1A3300",
-            "warning": "#B58900",
-            "warning_muted": "#3D2E00",
-            "error": "#DC322F",
-            "error_muted": "#4A1110",
-            # Special
-            "unread_dot": "#2AA198",
-            "star_active": "#B58900",
-            "star_inactive": "#586E75",
-        },
+        "light": _SOLARIZED_LIGHT_COLORS,
+        "dark": _SOLARIZED_DARK_COLORS,
     },
 }
 
@@ -117,63 +123,7 @@ SOLARIZED_DARK_THEME = {
         "base": "dark",
     },
     "colors": {
-        "light": {
-            # Light variant (same as Solarized Light)
-            "bg_primary": "#FDF6E3",
-            "bg_secondary": "#EEE8D5",
-            "bg_tertiary": "#E4DCC6",
-            "bg_elevated": "#FFFFFF",
-            "text_primary": "#073642",
-            "text_secondary": "#586E75",
-            "text_tertiary": "#657B83",
-            "text_disabled": "#93A1A1",
-            "border_default": "#EEE8D5",
-            "border_subtle": "#F5EED9",
-            "border_strong": "#D8D0B8",
-            "hover": "#EEE8D5",
-            "active": "#E4DCC6",
-            "focus_ring": "#268BD2",
-            "accent": "#268BD2",
-            "accent_hover": "#1A6699",
-            "accent_muted": "#E8F4FC",
-            "success": "#859900",
-            "success_muted": "#E8EDD0",
-            "warning": "#B58900",
-            "warning_muted": "#F5EDD0",
-            "error": "#DC322F",
-            "error_muted": "#FBEAE9",
-            "unread_dot": "#2AA198",
-            "star_active": "#B58900",
-            "star_inactive": "#93A1A1",
-        },
-        "dark": {
-            # Dark mode - base03/base02 backgrounds
-            "bg_primary": "#002B36",
-            "bg_secondary": "#073642",
-            "bg_tertiary": "#0D4652",
-            "bg_elevated": "#073642",
-            "text_primary": "#FDF6E3",
-            "text_secondary": "#EEE8D5",
-            "text_tertiary": "#93A1A1",
-            "text_disabled": "#586E75",
-            "border_default": "#073642",
-            "border_subtle": "#002B36",
-            "border_strong": "#0D4652",
-            "hover": "#073642",
-            "active": "#0D4652",
-            "focus_ring": "#268BD2",
-            "accent": "#268BD2",
-            "accent_hover": "#3CA0E8",
-            "accent_muted": "#0D3A47",
-            "success": "#859900",
-            "success_muted": "#1A3300",
-            "warning": "#B58900",
-            "warning_muted": "#3D2E00",
-            "error": "#DC322F",
-            "error_muted": "#4A1110",
-            "unread_dot": "#2AA198",
-            "star_active": "#B58900",
-            "star_inactive": "#586E75",
-        },
+        "light": _SOLARIZED_LIGHT_COLORS,
+        "dark": _SOLARIZED_DARK_COLORS,
     },
 }
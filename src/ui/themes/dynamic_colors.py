@@ -4,36 +4,54 @@ Creates Colors-compatible classes at runtime from theme data,
 with fallback to default design tokens for missing values.
 """
 
+import functools
+import sys
 from typing import Optional, Type
 
 from .design_tokens import Colors
 from .theme_schema import ThemeColorSet, ThemeSchema
 
+# (Colors attribute, ThemeColorSet field) pairs for every themeable color
+_COLOR_ATTRS: tuple[tuple[str, str], ...] = tuple(
+    (sys.intern(field.upper()), sys.intern(field)) for field in ThemeColorSet.model_fields
+)
 
-def _get_color_with_fallback(
+# Default color per attribute, read once from the design tokens
+_LIGHT_DEFAULTS: dict[str, str] = {
+    attr: sys.intern(getattr(Colors.Light, attr)) for attr, _ in _COLOR_ATTRS
+}
+_DARK_DEFAULTS: dict[str, str] = {
+    attr: sys.intern(getattr(Colors.Dark, attr)) for attr, _ in _COLOR_ATTRS
+}
+
+
+def _build_colors_class(
+    name: str,
+    mode: str,
     theme_colors: Optional[ThemeColorSet],
-    attr_name: str,
-    default_class: Type,
-) -> str:
-    """Get a color value with fallback to default.
+    defaults: dict[str, str],
+) -> Type:
+    """Build a Colors-compatible class, falling back to defaults per color.
 
     Args:
+        name: Class name (e.g., 'ThemeLightColors').
+        mode: Mode name used in the class docstring ('light' or 'dark').
         theme_colors: Theme color set (may be None).
-        attr_name: Attribute name in snake_case (e.g., 'bg_primary').
-        default_class: Default Colors class (Colors.Light or Colors.Dark).
+        defaults: Default colors by attribute (_LIGHT_DEFAULTS or _DARK_DEFAULTS).
 
     Returns:
-        Color value (hex string).
+        A class whose attributes (e.g., BG_PRIMARY) hold color values (hex
+        strings), interned so that equal colors across palettes and theme
+        reloads are the same object.
     """
-    if theme_colors is not None:
-        # Try to get value from theme (snake_case in schema)
-        value = getattr(theme_colors, attr_name, None)
+    theme_values = vars(theme_colors) if theme_colors is not None else {}
+    attrs = dict(defaults)
+    for attr, field in _COLOR_ATTRS:
+        value = theme_values.get(field)
         if value is not None:
-            return value
-
-    # Fallback to default (UPPER_SNAKE_CASE in Colors class)
-    default_attr = attr_name.upper()
-    return getattr(default_class, default_attr)
+            attrs[attr] = sys.intern(value)
+    attrs["__doc__"] = f"Dynamically generated {mode} mode colors."
+    return type(name, (), attrs)
 
 
 def create_light_colors_from_theme(theme: ThemeSchema) -> Type:
@@ -46,52 +64,7 @@ def create_light_colors_from_theme(theme: ThemeSchema) -> Type:
         A class with color attributes matching Colors.Light interface.
     """
     theme_colors = theme.colors.light if theme.colors else None
-    default = Colors.Light
-
-    class ThemeLightColors:
-        """Dynamically generated light mode colors."""
-
-        # Background layers
-        BG_PRIMARY = _get_color_with_fallback(theme_colors, "bg_primary", default)
-        BG_SECONDARY = _get_color_with_fallback(theme_colors, "bg_secondary", default)
-        BG_TERTIARY = _get_color_with_fallback(theme_colors, "bg_tertiary", default)
-        BG_ELEVATED = _get_color_with_fallback(theme_colors, "bg_elevated", default)
-
-        # Text hierarchy
-        TEXT_PRIMARY = _get_color_with_fallback(theme_colors, "text_primary", default)
-        TEXT_SECONDARY = _get_color_with_fallback(theme_colors, "text_secondary", default)
-        TEXT_TERTIARY = _get_color_with_fallback(theme_colors, "text_tertiary", default)
-        TEXT_DISABLED = _get_color_with_fallback(theme_colors, "text_disabled", default)
-
-        # Borders
-        BORDER_DEFAULT = _get_color_with_fallback(theme_colors, "border_default", default)
-        BORDER_SUBTLE = _get_color_with_fallback(theme_colors, "border_subtle", default)
-        BORDER_STRONG = _get_color_with_fallback(theme_colors, "border_strong", default)
-
-        # Interactive states
-        HOVER = _get_color_with_fallback(theme_colors, "hover", default)
-        ACTIVE = _get_color_with_fallback(theme_colors, "active", default)
-        FOCUS_RING = _get_color_with_fallback(theme_colors, "focus_ring", default)
-
-        # Accent
-        ACCENT = _get_color_with_fallback(theme_colors, "accent", default)
-        ACCENT_HOVER = _get_color_with_fallback(theme_colors, "accent_hover", default)
-        ACCENT_MUTED = _get_color_with_fallback(theme_colors, "accent_muted", default)
-
-        # Semantic colors
-        SUCCESS = _get_color_with_fallback(theme_colors, "success", default)
-        SUCCESS_MUTED = _get_color_with_fallback(theme_colors, "success_muted", default)
-        WARNING = _get_color_with_fallback(theme_colors, "warning", default)
-        WARNING_MUTED = _get_color_with_fallback(theme_colors, "warning_muted", default)
-        ERROR = _get_color_with_fallback(theme_colors, "error", default)
-        ERROR_MUTED = _get_color_with_fallback(theme_colors, "error_muted", default)
-
-        # Special
-        UNREAD_DOT = _get_color_with_fallback(theme_colors, "unread_dot", default)
-        STAR_ACTIVE = _get_color_with_fallback(theme_colors, "star_active", default)
-        STAR_INACTIVE = _get_color_with_fallback(theme_colors, "star_inactive", default)
-
-    return ThemeLightColors
+    return _build_colors_class("ThemeLightColors", "light", theme_colors, _LIGHT_DEFAULTS)
 
 
 def create_dark_colors_from_theme(theme: ThemeSchema) -> Type:
@@ -104,64 +77,29 @@ def create_dark_colors_from_theme(theme: ThemeSchema) -> Type:
         A class with color attributes matching Colors.Dark interface.
     """
     theme_colors = theme.colors.dark if theme.colors else None
-    default = Colors.Dark
-
-    class ThemeDarkColors:
-        """Dynamically generated dark mode colors."""
-
-        # Background layers
-        BG_PRIMARY = _get_color_with_fallback(theme_colors, "bg_primary", default)
-        BG_SECONDARY = _get_color_with_fallback(theme_colors, "bg_secondary", default)
-        BG_TERTIARY = _get_color_with_fallback(theme_colors, "bg_tertiary", default)
-        BG_ELEVATED = _get_color_with_fallback(theme_colors, "bg_elevated", default)
-
-        # Text hierarchy
-        TEXT_PRIMARY = _get_color_with_fallback(theme_colors, "text_primary", default)
-        TEXT_SECONDARY = _get_color_with_fallback(theme_colors, "text_secondary", default)
-        TEXT_TERTIARY = _get_color_with_fallback(theme_colors, "text_tertiary", default)
-        TEXT_DISABLED = _get_color_with_fallback(theme_colors, "text_disabled", default)
-
-        # Borders
-        BORDER_DEFAULT = _get_color_with_fallback(theme_colors, "border_default", default)
-        BORDER_SUBTLE = _get_color_with_fallback(theme_colors, "border_subtle", default)
-        BORDER_STRONG = _get_color_with_fallback(theme_colors, "border_strong", default)
-
-        # Interactive states
-        HOVER = _get_color_with_fallback(theme_colors, "hover", default)
-        ACTIVE = _get_color_with_fallback(theme_colors, "active", default)
-        FOCUS_RING = _get_color_with_fallback(theme_colors, "focus_ring", default)
-
-        # Accent
-        ACCENT = _get_color_with_fallback(theme_colors, "accent", default)
-        ACCENT_HOVER = _get_color_with_fallback(theme_colors, "accent_hover", default)
-        ACCENT_MUTED = _get_color_with_fallback(theme_colors, "accent_muted", default)
-
-        # Semantic colors
-        SUCCESS = _get_color_with_fallback(theme_colors, "success", default)
-        SUCCESS_MUTED = _get_color_with_fallback(theme_colors, "success_muted", default)
-        WARNING = _get_color_with_fallback(theme_colors, "warning", default)
-        WARNING_MUTED = _get_color_with_fallback(theme_colors, "warning_muted", default)
-        ERROR = _get_color_with_fallback(theme_colors, "error", default)
-        ERROR_MUTED = _get_color_with_fallback(theme_colors, "error_muted", default)
-
-        # Special
-        UNREAD_DOT = _get_color_with_fallback(theme_colors, "unread_dot", default)
-        STAR_ACTIVE = _get_color_with_fallback(theme_colors, "star_active", default)
-        STAR_INACTIVE = _get_color_with_fallback(theme_colors, "star_inactive", default)
-
-    return ThemeDarkColors
+    return _build_colors_class("ThemeDarkColors", "dark", theme_colors, _DARK_DEFAULTS)
+
+
+@functools.lru_cache(maxsize=8)
+def _create_colors_from_json(theme_json: str) -> tuple[Type, Type]:
+    """Build both color classes for a serialized theme, cached by its JSON."""
+    theme = ThemeSchema.model_validate_json(theme_json)
+    return (
+        create_light_colors_from_theme(theme),
+        create_dark_colors_from_theme(theme),
+    )
 
 
 def create_colors_from_theme(theme: ThemeSchema) -> tuple[Type, Type]:
     """Create both Light and Dark color classes from a theme.
 
+    Re-applying an unchanged theme returns the same classes, so caches
+    keyed on the color classes (e.g. AppTheme's Flet theme cache) still hit.
+
     Args:
         theme: Validated theme schema.
 
     Returns:
         Tuple of (LightColors, DarkColors) classes.
     """
-    return (
-        create_light_colors_from_theme(theme),
-        create_dark_colors_from_theme(theme),
-    )
+    return _create_colors_from_json(theme.model_dump_json())
@@ -76,7 +76,7 @@ class ThemeColorSet(BaseModel):
         """Validate color format (hex colors)."""
         if v is None:
             return None
-        if isinstance(v, str) and (v.startswith("#") or v.startswith("rgb")):
+        if isinstance(v, str) and v.startswith(("#", "rgb")):
             return v
         return None
 
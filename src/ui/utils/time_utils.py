@@ -1,14 +1,25 @@
 """Time formatting utilities."""
 
-from datetime import datetime, timezone
+import functools
+from datetime import date, datetime, timezone
 from typing import Optional
 
 
-def format_relative_time(dt: Optional[datetime]) -> str:
+@functools.lru_cache(maxsize=512)
+def _format_date(day: date) -> str:
+    """Format a date like "Jan 05", cached since list rows share dates."""
+    return day.strftime("%b %d")
+
+
+def format_relative_time(
+    dt: Optional[datetime], now: Optional[datetime] = None
+) -> str:
     """Format datetime as a human-readable relative time string.
 
     Args:
         dt: Datetime to format (should be timezone-aware).
+        now: Reference time (timezone-aware). Callers formatting many rows
+            can pass one value for the whole batch; defaults to the current time.
 
     Returns:
         Relative time string like "Just now", "5 min ago", "2 hours ago",
@@ -18,7 +29,8 @@ def format_relative_time(dt: Optional[datetime]) -> str:
         return "Never"
 
     # Ensure we're comparing timezone-aware datetimes
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
 
@@ -44,4 +56,4 @@ def format_relative_time(dt: Optional[datetime]) -> str:
         return f"{weeks} week{'s' if weeks > 1 else ''} ago"
 
     # For older dates, show the actual date
-    return dt.strftime("%b %d")
+    return _format_date(dt.date())
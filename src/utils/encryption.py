@@ -1,6 +1,7 @@
 """Encryption utilities for securing credentials in the database."""
 
 import base64
+import functools
 import hashlib
 
 from cryptography.fernet import Fernet
@@ -8,16 +9,25 @@ from cryptography.fernet import Fernet
 from src.config.settings import get_settings
 
 
-def _get_fernet() -> Fernet:
-    """Get Fernet instance with key derived from settings."""
-    settings = get_settings()
+@functools.lru_cache(maxsize=1)
+def _fernet_for_key(encryption_key: str) -> Fernet:
+    """Build the Fernet instance for an encryption key.
+
+    Cached so the SHA-256 derivation runs once per key rather than on
+    every encrypt/decrypt call.
+    """
     # Derive a 32-byte key from the encryption key using SHA-256
-    key_bytes = hashlib.sha256(settings.encryption_key.encode()).digest()
+    key_bytes = hashlib.sha256(encryption_key.encode()).digest()
     # Fernet requires a URL-safe base64-encoded 32-byte key
     fernet_key = base64.urlsafe_b64encode(key_bytes)
     return Fernet(fernet_key)
 
 
+def _get_fernet() -> Fernet:
+    """Get Fernet instance with key derived from settings."""
+    return _fernet_for_key(get_settings().encryption_key)
+
+
 def encrypt_value(plaintext: str) -> str:
     """Encrypt a string value.
 
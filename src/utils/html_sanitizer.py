@@ -1,73 +1,154 @@
 """HTML sanitization utilities for safe email rendering."""
 
+import html
+import logging
+import re
+import threading
 from typing import Optional
 
-import bleach
 import html2text
 from bleach.css_sanitizer import CSSSanitizer
+from bleach.linkifier import Linker
+from bleach.sanitizer import Cleaner
+
+logger = logging.getLogger(__name__)
+
+# Bodies longer than this (in characters) skip the HTML sanitizers, whose
+# cost grows with size and can blow up on pathological markup, and are
+# rendered as escaped plain text instead
+MAX_SANITIZE_LENGTH = 2_000_000
+
+# Tags removed outright by sanitize_html_for_webview
+_DANGEROUS_TAGS = frozenset(
+    {"script", "iframe", "object", "embed", "form", "input", "button"}
+)
+
+# Event handler attributes stripped by sanitize_html_for_webview
+_DANGEROUS_ATTRS = frozenset(
+    {"onclick", "onload", "onerror", "onmouseover", "onfocus", "onblur"}
+)
+
+# Any tag; excluding "<" keeps each match attempt bounded by the next tag
+_ANY_TAG_RE = re.compile(r"<[^<>]*>")
+
+# Script/style block with its contents; an unclosed one runs to the end, as in
+# browsers, which keeps a failed match from rescanning for every opener
+_SCRIPT_STYLE_BLOCK_RE = re.compile(
+    r"<(script|style)\b[^<>]*>(?:.*?</\1\s*>|.*)", re.IGNORECASE | re.DOTALL
+)
+
+# Container div that html_to_safe_content wraps sanitized content in
+_SAFE_CONTENT_PREFIX = """
+    <div style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
+                line-height: 1.6;
+                color: inherit;
+                max-width: 100%;
+                overflow-wrap: break-word;">
+        """
+_SAFE_CONTENT_SUFFIX = """
+    </div>
+    """
+
+# Document shell that sanitize_html_for_webview wraps HTML fragments in
+_WEBVIEW_DOCUMENT_PREFIX = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
+            line-height: 1.6;
+            padding: 16px;
+            margin: 0;
+            background-color: #1e1e1e;
+            color: #e0e0e0;
+        }
+        a { color: #6db3f2; }
+        img {
+            max-width: 100%;
+            height: auto;
+        }
+        /* Hide broken images gracefully */
+        img[src]::before {
+            content: '';
+            display: block;
+        }
+    </style>
+</head>
+<body>
+"""
+_WEBVIEW_DOCUMENT_SUFFIX = """
+</body>
+</html>"""
+
+# CSS appended to the head of full HTML documents
+_WEBVIEW_HEAD_CSS = "img { max-width: 100%; height: auto; }"
 
 # Allowed HTML tags for email content
-ALLOWED_TAGS = [
-    "a",
-    "abbr",
-    "acronym",
-    "address",
-    "b",
-    "blockquote",
-    "body",
-    "br",
-    "center",
-    "code",
-    "dd",
-    "del",
-    "dfn",
-    "div",
-    "dl",
-    "dt",
-    "em",
-    "font",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "head",
-    "hr",
-    "html",
-    "i",
-    "img",
-    "ins",
-    "kbd",
-    "li",
-    "link",
-    "meta",
-    "ol",
-    "p",
-    "pre",
-    "q",
-    "s",
-    "samp",
-    "small",
-    "span",
-    "strike",
-    "strong",
-    "style",
-    "sub",
-    "sup",
-    "table",
-    "tbody",
-    "td",
-    "tfoot",
-    "th",
-    "thead",
-    "title",
-    "tr",
-    "tt",
-    "u",
-    "ul",
-    "var",
-]
+ALLOWED_TAGS = frozenset(
+    {
+        "a",
+        "abbr",
+        "acronym",
+        "address",
+        "b",
+        "blockquote",
+        "body",
+        "br",
+        "center",
+        "code",
+        "dd",
+        "del",
+        "dfn",
+        "div",
+        "dl",
+        "dt",
+        "em",
+        "font",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "head",
+        "hr",
+        "html",
+        "i",
+        "img",
+        "ins",
+        "kbd",
+        "li",
+        "link",
+        "meta",
+        "ol",
+        "p",
+        "pre",
+        "q",
+        "s",
+        "samp",
+        "small",
+        "span",
+        "strike",
+        "strong",
+        "style",
+        "sub",
+        "sup",
+        "table",
+        "tbody",
+        "td",
+        "tfoot",
+        "th",
+        "thead",
+        "title",
+        "tr",
+        "tt",
+        "u",
+        "ul",
+        "var",
+    }
+)
 
 # Allowed HTML attributes
 ALLOWED_ATTRIBUTES = {
@@ -122,6 +203,33 @@ ALLOWED_STYLES = [
 ]
 
 
+# bleach cleaners/linkers hold parser state and are not thread-safe,
+# so each thread builds its own pair once and reuses it
+_bleach_local = threading.local()
+
+
+def _get_bleach_pipeline() -> tuple[Cleaner, Linker]:
+    """Get this thread's configured bleach cleaner and linker.
+
+    Returns:
+        Tuple of (cleaner, linker).
+    """
+    pipeline = getattr(_bleach_local, "pipeline", None)
+    if pipeline is None:
+        cleaner = Cleaner(
+            tags=ALLOWED_TAGS,
+            attributes=ALLOWED_ATTRIBUTES,
+            css_sanitizer=CSSSanitizer(allowed_css_properties=ALLOWED_STYLES),
+            strip=True,
+        )
+        linker = Linker(
+            callbacks=[_add_link_attributes],
+            skip_tags=["pre", "code"],
+        )
+        pipeline = _bleach_local.pipeline = (cleaner, linker)
+    return pipeline
+
+
 def sanitize_html(html_content: Optional[str]) -> str:
     """Sanitize HTML content for safe rendering.
 
@@ -134,26 +242,16 @@ def sanitize_html(html_content: Optional[str]) -> str:
     if not html_content:
         return ""
 
-    # Configure CSS sanitizer with allowed properties
-    css_sanitizer = CSSSanitizer(allowed_css_properties=ALLOWED_STYLES)
+    if len(html_content) > MAX_SANITIZE_LENGTH:
+        return _oversized_to_text(html_content)
+
+    cleaner, linker = _get_bleach_pipeline()
 
     # Clean the HTML
-    cleaned = bleach.clean(
-        html_content,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRIBUTES,
-        css_sanitizer=css_sanitizer,
-        strip=True,
-    )
+    cleaned = cleaner.clean(html_content)
 
     # Add target="_blank" and rel="noopener" to all links for security
-    cleaned = bleach.linkify(
-        cleaned,
-        callbacks=[_add_link_attributes],
-        skip_tags=["pre", "code"],
-    )
-
-    return cleaned
+    return linker.linkify(cleaned)
 
 
 def _add_link_attributes(attrs: dict, new: bool = False) -> dict:
@@ -183,15 +281,7 @@ def html_to_safe_content(html_content: Optional[str]) -> str:
     sanitized = sanitize_html(html_content)
 
     # Wrap in a container with basic styling
-    return f"""
-    <div style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
-                line-height: 1.6;
-                color: inherit;
-                max-width: 100%;
-                overflow-wrap: break-word;">
-        {sanitized}
-    </div>
-    """
+    return "".join((_SAFE_CONTENT_PREFIX, sanitized, _SAFE_CONTENT_SUFFIX))
 
 
 def sanitize_html_for_webview(html_content: Optional[str]) -> str:
@@ -209,76 +299,69 @@ def sanitize_html_for_webview(html_content: Optional[str]) -> str:
     if not html_content:
         return ""
 
+    if len(html_content) > MAX_SANITIZE_LENGTH:
+        return "".join(
+            (
+                _WEBVIEW_DOCUMENT_PREFIX,
+                '<div style="white-space: pre-wrap;">',
+                _oversized_to_text(html_content),
+                "</div>",
+                _WEBVIEW_DOCUMENT_SUFFIX,
+            )
+        )
+
     from bs4 import BeautifulSoup
 
     soup = BeautifulSoup(html_content, "html.parser")
 
     # Remove dangerous tags (script, iframe, object, embed, form)
-    dangerous_tags = ["script", "iframe", "object", "embed", "form", "input", "button"]
-    for tag in soup.find_all(dangerous_tags):
+    for tag in soup.find_all(_DANGEROUS_TAGS):
         tag.decompose()
 
     # Remove dangerous attributes
-    dangerous_attrs = ["onclick", "onload", "onerror", "onmouseover", "onfocus", "onblur"]
     for tag in soup.find_all(True):
-        for attr in dangerous_attrs:
-            if tag.has_attr(attr):
-                del tag[attr]
+        for attr in _DANGEROUS_ATTRS.intersection(tag.attrs):
+            del tag[attr]
 
     # Add security attributes to links
     for link in soup.find_all("a"):
         link["target"] = "_blank"
         link["rel"] = "noopener noreferrer"
 
-    # Return as string with proper HTML structure
-    result = str(soup)
-
     # Ensure we have a complete HTML document for WebView
-    if "<html" not in result.lower():
-        result = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
-            line-height: 1.6;
-            padding: 16px;
-            margin: 0;
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-        }}
-        a {{ color: #6db3f2; }}
-        img {{
-            max-width: 100%;
-            height: auto;
-        }}
-        /* Hide broken images gracefully */
-        img[src]::before {{
-            content: '';
-            display: block;
-        }}
-    </style>
-</head>
-<body>
-{result}
-</body>
-</html>"""
+    if soup.html is None:
+        result = "".join((_WEBVIEW_DOCUMENT_PREFIX, str(soup), _WEBVIEW_DOCUMENT_SUFFIX))
     else:
         # For emails with existing HTML structure, inject CSS to handle broken images
-        result = result.replace(
-            "</head>",
-            """<style>
-        img { max-width: 100%; height: auto; }
-    </style>
-</head>""",
-            1,
-        )
+        if soup.head is not None:
+            soup.head.append(soup.new_tag("style", string=_WEBVIEW_HEAD_CSS))
+        result = str(soup)
 
     return result
 
 
+def _oversized_to_text(html_content: str) -> str:
+    """Reduce an oversized HTML body to escaped text without parsing it.
+
+    Script and style blocks are dropped with their contents, every other tag
+    is dropped and the remaining text is HTML-escaped, so nothing in the
+    result can be interpreted as markup.
+
+    Args:
+        html_content: HTML content longer than MAX_SANITIZE_LENGTH.
+
+    Returns:
+        Escaped text safe to embed in HTML.
+    """
+    logger.warning(
+        f"HTML body of {len(html_content)} characters exceeds "
+        f"{MAX_SANITIZE_LENGTH}, rendering as plain text"
+    )
+    text = _SCRIPT_STYLE_BLOCK_RE.sub(" ", html_content)
+    text = _ANY_TAG_RE.sub(" ", text)
+    return html.escape(html.unescape(text))
+
+
 def html_to_plain_text(html_content: Optional[str]) -> str:
     """Convert HTML to plain text for LLM processing.
 
@@ -265,6 +265,8 @@ def mock_app(
     mock.fetch_queue_service = mock_fetch_queue_service
     mock.show_snackbar = MagicMock()
     mock.navigate = MagicMock()
+    mock.get_cached_user_email = MagicMock(return_value=None)
+    mock.get_cached_newsletters = MagicMock(return_value=None)
 
     # Mock session context manager
     async def mock_get_session():
@@ -0,0 +1,59 @@
+"""Tests for NewsletterApp startup behavior."""
+
+from unittest.mock import MagicMock, patch
+
+import flet as ft
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app import NewsletterApp
+from src.repositories.user_settings_repository import UserSettingsRepository
+from src.ui.themes.theme_schema import ThemeSchema
+
+
+class TestLoadSavedTheme:
+    """Test restoring the saved theme and appearance mode at startup."""
+
+    @pytest.fixture
+    def session_maker(self, async_engine):
+        """Create a session maker bound to the test database."""
+        return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def _load(self, session_maker, theme_mode):
+        """Save a custom dark theme plus theme_mode, then run the startup load."""
+        async with session_maker() as session:
+            repo = UserSettingsRepository(session)
+            await repo.update_active_theme("custom.json")
+            await repo.update_theme_mode(theme_mode)
+            await session.commit()
+
+        app = NewsletterApp(page=MagicMock())
+        app._session_maker = session_maker
+        theme = ThemeSchema.model_validate(
+            {"metadata": {"name": "Custom", "base": "dark"}}
+        )
+        theme_service = MagicMock()
+        theme_service.load_theme.return_value = (True, theme, None)
+        theme_service.apply_theme.return_value = (MagicMock(), MagicMock())
+
+        with patch(
+            "src.services.theme_service.ThemeService", return_value=theme_service
+        ), patch("src.app.AppTheme"):
+            await app._load_saved_theme()
+
+        return app.page.theme_mode
+
+    @pytest.mark.asyncio
+    async def test_explicit_system_mode_survives_custom_theme(self, session_maker):
+        """Verify an explicit System choice is not replaced by the theme's base."""
+        assert await self._load(session_maker, "system") == ft.ThemeMode.SYSTEM
+
+    @pytest.mark.asyncio
+    async def test_explicit_light_mode_survives_dark_theme(self, session_maker):
+        """Verify an explicit Light choice wins over a dark custom theme."""
+        assert await self._load(session_maker, "light") == ft.ThemeMode.LIGHT
+
+    @pytest.mark.asyncio
+    async def test_unset_mode_follows_custom_theme_base(self, session_maker):
+        """Verify the theme's base mode is used when no mode was ever chosen."""
+        assert await self._load(session_maker, None) == ft.ThemeMode.DARK
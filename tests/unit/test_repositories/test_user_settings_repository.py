@@ -186,6 +186,31 @@ class TestUserSettingsRepositoryTheme:
 
         assert result.active_theme == "default.json"
 
+    @pytest.mark.asyncio
+    async def test_update_theme_mode(self, repo, async_session):
+        """Verify update_theme_mode updates the setting."""
+        result = await repo.update_theme_mode("dark")
+        await async_session.commit()
+
+        assert result.theme_mode == "dark"
+
+    @pytest.mark.asyncio
+    async def test_update_theme_mode_keeps_explicit_system(self, repo, async_session):
+        """Verify an explicit system choice is stored as 'system'."""
+        result = await repo.update_theme_mode("system")
+        await async_session.commit()
+
+        assert result.theme_mode == "system"
+
+    @pytest.mark.asyncio
+    async def test_update_theme_mode_to_none_clears_choice(self, repo, async_session):
+        """Verify update_theme_mode with None clears the saved mode."""
+        await repo.update_theme_mode("dark")
+        result = await repo.update_theme_mode(None)
+        await async_session.commit()
+
+        assert result.theme_mode is None
+
 
 class TestUserSettingsRepositoryInheritance:
     """Test that repository inherits base operations."""
@@ -189,6 +189,20 @@ class TestDynamicColors:
         assert dark.BG_PRIMARY == Colors.Dark.BG_PRIMARY
         assert dark.ACCENT == Colors.Dark.ACCENT
 
+    def test_create_colors_reuses_classes_for_same_theme(self):
+        """Test that an unchanged theme maps to the same color classes."""
+        data = {
+            "metadata": {"name": "Test"},
+            "colors": {"light": {"accent": "#FF0000"}},
+        }
+        first = create_colors_from_theme(ThemeSchema.model_validate(data))
+        second = create_colors_from_theme(ThemeSchema.model_validate(data))
+        data["colors"]["light"]["accent"] = "#00FF00"
+        changed = create_colors_from_theme(ThemeSchema.model_validate(data))
+
+        assert first[0] is second[0] and first[1] is second[1]
+        assert changed[0].ACCENT == "#00FF00"
+
 
 class TestThemeService:
     """Tests for ThemeService."""
@@ -238,6 +252,18 @@ class TestThemeService:
         assert error is None
         assert theme.metadata.name == "Default"
 
+    def test_load_theme_reuses_schema_until_file_changes(self, service, temp_themes_dir):
+        """Test that unchanged theme files are not re-validated."""
+        _, first, _ = service.load_theme("default.json")
+        _, second, _ = service.load_theme("default.json")
+        assert first is second
+
+        data = json.loads((temp_themes_dir / "default.json").read_text())
+        data["metadata"]["name"] = "Edited"
+        (temp_themes_dir / "default.json").write_text(json.dumps(data))
+        _, edited, _ = service.load_theme("default.json")
+        assert edited.metadata.name == "Edited"
+
     def test_load_theme_not_found(self, service):
         """Test loading a non-existent theme."""
         success, theme, error = service.load_theme("nonexistent.json")
@@ -496,6 +522,20 @@ class TestBuiltinThemes:
 
         assert not missing, f"{filename} dark mode missing colors: {missing}"
 
+    @pytest.mark.parametrize("filename", list(ALL_BUILTIN_THEMES.keys()))
+    def test_builtin_theme_palettes_match_schema_keys(self, filename):
+        """Test both palettes use exactly the ThemeColorSet keys.
+
+        ThemeSchema ignores unknown keys, so a misspelt token would
+        otherwise fall back to the default color without any error.
+        """
+        expected = set(ThemeColorSet.model_fields)
+        for mode in ("light", "dark"):
+            keys = set(ALL_BUILTIN_THEMES[filename]["colors"][mode])
+            assert keys == expected, (
+                f"{filename} {mode} unknown: {keys - expected}, missing: {expected - keys}"
+            )
+
     @pytest.mark.parametrize("filename", list(ALL_BUILTIN_THEMES.keys()))
     def test_builtin_theme_colors_are_valid_hex(self, filename, hex_pattern):
         """Test all color values are valid hex codes."""
@@ -540,6 +580,19 @@ class TestBuiltinThemes:
         undefined = registered_themes - defined_themes
         assert not undefined, f"Themes in BUILTIN_THEMES but not defined: {undefined}"
 
+    def test_lazy_builtin_theme_exports_resolve(self):
+        """Test every exported theme name loads the dict the mapping returns."""
+        from src.ui.themes import builtin_themes
+
+        for filename, name in builtin_themes._THEME_FILES.items():
+            assert getattr(builtin_themes, name) is ALL_BUILTIN_THEMES[filename]
+        assert set(builtin_themes.__all__) == {
+            "ALL_BUILTIN_THEMES",
+            "BUILTIN_THEME_FILES",
+        } | set(
+            builtin_themes._THEME_FILES.values()
+        )
+
     def test_all_expected_themes_present(self):
         """Test all expected popular themes are present."""
         expected_themes = {
@@ -0,0 +1,130 @@
+"""Unit tests for Sidebar component."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import flet as ft
+
+from src.ui.components.sidebar import NewsletterNavItem, Sidebar
+
+
+def make_newsletter(newsletter_id, name="Daily", unread_count=0):
+    """Create a newsletter-like object with the fields the sidebar renders."""
+    return SimpleNamespace(
+        id=newsletter_id,
+        name=name,
+        color="#112233",
+        color_secondary=None,
+        unread_count=unread_count,
+    )
+
+
+def newsletter_rows(sidebar):
+    """Get the newsletter nav items currently in the sidebar."""
+    section = sidebar._newsletters_slot.content
+    if not isinstance(section, ft.Column):
+        return []
+    return [
+        control
+        for control in section.controls[1].controls
+        if isinstance(control, NewsletterNavItem)
+    ]
+
+
+class TestSidebarUpdateNewsletters:
+    """Tests for Sidebar.update_newsletters."""
+
+    def test_sidebar_creates_newsletter_rows(self):
+        """Test a row is built for each newsletter."""
+        sidebar = Sidebar("/home", newsletters=[make_newsletter(1), make_newsletter(2)])
+        assert [row.newsletter_id for row in newsletter_rows(sidebar)] == [1, 2]
+
+    def test_update_newsletters_unchanged_skips_update(self):
+        """Test unchanged newsletters do not rebuild or update the sidebar."""
+        sidebar = Sidebar("/home", newsletters=[make_newsletter(1)])
+        sidebar._newsletters_slot.update = MagicMock()
+        section = sidebar._newsletters_slot.content
+
+        sidebar.update_newsletters([make_newsletter(1)])
+
+        sidebar._newsletters_slot.update.assert_not_called()
+        assert sidebar._newsletters_slot.content is section
+
+    def test_update_newsletters_reuses_unchanged_rows(self):
+        """Test only changed rows are rebuilt."""
+        sidebar = Sidebar(
+            "/home", newsletters=[make_newsletter(1), make_newsletter(2)]
+        )
+        sidebar._newsletters_slot.update = MagicMock()
+        first, second = newsletter_rows(sidebar)
+
+        sidebar.update_newsletters(
+            [make_newsletter(1), make_newsletter(2, unread_count=3)]
+        )
+
+        sidebar._newsletters_slot.update.assert_called_once()
+        new_first, new_second = newsletter_rows(sidebar)
+        assert new_first is first
+        assert new_second is not second
+
+    def test_reused_rows_follow_new_navigate_callback(self):
+        """Test reused rows call the callback of the view now holding the sidebar."""
+        sidebar = Sidebar("/home", newsletters=[make_newsletter(1)])
+        (row,) = newsletter_rows(sidebar)
+        on_navigate = MagicMock()
+
+        sidebar.set_route("/home", on_navigate)
+
+        (reused,) = newsletter_rows(sidebar)
+        assert reused is row
+        reused._handle_click(None)
+        on_navigate.assert_called_once_with("/newsletter/1")
+
+
+class TestSidebarSetRoute:
+    """Tests for Sidebar.set_route."""
+
+    def test_set_route_keeps_existing_controls(self):
+        """Test a route change restyles the existing controls instead of rebuilding."""
+        sidebar = Sidebar("/home", newsletters=[make_newsletter(1)])
+        content = sidebar.content
+        section = sidebar._newsletters_slot.content
+        (row,) = newsletter_rows(sidebar)
+
+        sidebar.set_route("/newsletter/1")
+
+        assert sidebar.content is content
+        assert sidebar._newsletters_slot.content is section
+        assert newsletter_rows(sidebar)[0] is row
+
+    def test_set_route_moves_active_state(self):
+        """Test only the items matching the new route are marked active."""
+        sidebar = Sidebar("/home", newsletters=[make_newsletter(1), make_newsletter(2)])
+        home, manage, settings = sidebar._nav_items
+        first, second = newsletter_rows(sidebar)
+
+        sidebar.set_route("/newsletter/2")
+
+        assert not (home.is_active or manage.is_active or settings.is_active)
+        assert home.bgcolor is None
+        assert home._icon.icon == ft.Icons.HOME_OUTLINED
+        assert not first.is_active and first.border is None
+        assert second.is_active and second.border is not None
+
+        sidebar.set_route("/settings")
+
+        assert settings.is_active
+        assert settings._icon.icon == ft.Icons.SETTINGS
+        assert settings._label.weight == ft.FontWeight.W_500
+        assert not second.is_active and second.border is None
+
+    def test_update_newsletters_after_set_route_keeps_active_row(self):
+        """Test rows rebuilt after a route change pick up the current route."""
+        sidebar = Sidebar("/home", newsletters=[make_newsletter(1)])
+        sidebar._newsletters_slot.update = MagicMock()
+        sidebar.set_route("/newsletter/1")
+
+        sidebar.update_newsletters([make_newsletter(1, unread_count=2)])
+
+        (row,) = newsletter_rows(sidebar)
+        assert row.is_active
@@ -16,6 +16,8 @@ def mock_app():
     mock.page.go = MagicMock()
     mock.navigate = MagicMock()
     mock.show_snackbar = MagicMock()
+    mock.get_cached_user_email = MagicMock(return_value=None)
+    mock.get_cached_newsletters = MagicMock(return_value=None)
     mock.gmail_service = MagicMock()
     mock.gmail_service.get_labels = MagicMock(return_value=[])
     mock.fetch_queue_service = AsyncMock()
@@ -143,6 +145,17 @@ class TestEmailListPage:
             page = EmailListPage(app=mock_app, newsletter_id=1)
             assert page.sidebar is not None
 
+    def test_email_list_page_uses_shared_sidebar(self, mock_app):
+        """Test page takes the app's shared sidebar for its route."""
+        with patch('src.ui.pages.email_list_page.NewsletterService'), \
+             patch('src.ui.pages.email_list_page.EmailService'):
+            from src.ui.pages.email_list_page import EmailListPage
+            page = EmailListPage(app=mock_app, newsletter_id=1)
+            mock_app.get_sidebar.assert_called_once_with(
+                "/newsletter/1", page._handle_navigate
+            )
+            assert page.sidebar is mock_app.get_sidebar.return_value
+
 
 class TestEmailReaderPage:
     """Tests for EmailReaderPage view."""
@@ -212,3 +225,115 @@ class TestSettingsPage:
         page = SettingsPage(app=mock_app)
         options = page.theme_dropdown.options
         assert len(options) == 3
+
+    def test_settings_page_same_appearance_mode_is_noop(self, mock_app):
+        """Test re-selecting the current appearance mode does not re-theme."""
+        from src.ui.pages.settings_page import SettingsPage
+        mock_app.page.theme_mode = ft.ThemeMode.DARK
+        page = SettingsPage(app=mock_app)
+        mock_app.page.update.reset_mock()
+
+        page._on_appearance_mode_change(MagicMock(data="dark"))
+
+        mock_app.page.update.assert_not_called()
+        assert mock_app.page.theme_mode == ft.ThemeMode.DARK
+
+    def test_settings_page_recolors_in_place_on_mode_change(self, mock_app):
+        """Test appearance change recolors controls without rebuilding the view."""
+        from src.ui.pages.settings_page import SettingsPage
+        from src.ui.themes import Colors
+
+        mock_app.page.theme_mode = ft.ThemeMode.LIGHT
+        with patch("src.ui.pages.settings_page.get_colors", return_value=Colors.Light):
+            page = SettingsPage(app=mock_app)
+        content = page.controls[0]
+        assert page.user_email_text.color == Colors.Light.TEXT_SECONDARY
+
+        with patch("src.ui.pages.settings_page.get_colors", return_value=Colors.Dark):
+            page._on_appearance_mode_change(MagicMock(data="dark"))
+
+        assert page.controls[0] is content
+        assert page.colors is Colors.Dark
+        assert page.user_email_text.color == Colors.Dark.TEXT_SECONDARY
+        assert page.llm_enabled_switch.active_color == Colors.Dark.ACCENT
+        assert mock_app.page.views == []
+
+    def test_settings_page_cancels_load_on_unmount(self, mock_app):
+        """Test pending data load is cancelled when the page unmounts."""
+        from src.ui.pages.settings_page import SettingsPage
+        page = SettingsPage(app=mock_app)
+        load_future = page._load_future
+
+        page.will_unmount()
+
+        load_future.cancel.assert_called_once()
+
+    async def test_settings_page_coalesces_overlapping_loads(self, mock_app):
+        """Test overlapping _load_data calls share one in-flight load."""
+        import asyncio
+
+        from src.ui.pages.settings_page import SettingsPage
+        page = SettingsPage(app=mock_app)
+        page.sidebar = MagicMock()
+
+        release = asyncio.Event()
+
+        async def slow_email():
+            await release.wait()
+            return "user@example.com"
+
+        page._load_user_email = AsyncMock(side_effect=slow_email)
+        page._load_user_settings = AsyncMock(return_value=[])
+
+        first = asyncio.create_task(page._load_data())
+        second = asyncio.create_task(page._load_data())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert page._load_user_email.await_count == 1
+        assert page.user_email_text.value == "user@example.com"
+        assert page._load_data_task is None
+
+    async def test_settings_page_reload_without_changes_skips_update(self, mock_app):
+        """Test a reload that changes nothing does not push an update."""
+        from src.ui.pages.settings_page import SettingsPage
+        page = SettingsPage(app=mock_app)
+        page.user_email_text.value = "user@example.com"
+        page._load_user_email = AsyncMock(return_value="user@example.com")
+        page._load_user_settings = AsyncMock(return_value=[])
+        mock_app.batch_update.reset_mock()
+
+        await page._load_data()
+
+        mock_app.batch_update.assert_not_called()
+
+    async def test_settings_page_rejects_bad_llm_url_without_session(self, mock_app):
+        """Test a malformed or unchanged API URL never opens a session."""
+        from src.ui.pages.settings_page import SettingsPage
+        page = SettingsPage(app=mock_app)
+        mock_app.get_session = MagicMock()
+        event = MagicMock()
+
+        event.control.value = "localhost:1234"
+        await page._on_llm_url_change(event)
+        assert event.control.value == page._llm_api_base_url
+        mock_app.show_snackbar.assert_called_once()
+
+        event.control.value = None
+        await page._on_llm_url_change(event)
+
+        mock_app.get_session.assert_not_called()
+
+    async def test_settings_page_reload_patches_only_changed_controls(self, mock_app):
+        """Test a mounted page sends only the controls a reload changed."""
+        from src.ui.pages.settings_page import SettingsPage
+        page = SettingsPage(app=mock_app)
+        page._load_user_email = AsyncMock(return_value="user@example.com")
+        page._load_user_settings = AsyncMock(return_value=[])
+        mock_app.page.update.reset_mock()
+
+        with patch.object(SettingsPage, "parent", new=mock_app.page):
+            await page._load_data()
+
+        mock_app.page.update.assert_called_once_with(page.user_email_text)
@@ -62,6 +62,18 @@ class TestFormatRelativeTime:
         assert len(result) > 0
         assert result != "Never"
 
+    def test_older_dates_format_month_and_day(self):
+        """Test that older dates use the abbreviated month and day."""
+        old_date = datetime(2024, 1, 5, 15, 30, tzinfo=timezone.utc)
+        assert format_relative_time(old_date) == "Jan 05"
+        assert format_relative_time(old_date.replace(hour=1)) == "Jan 05"
+
+    def test_explicit_now_is_used_as_reference(self):
+        """Test that a passed-in reference time replaces the current time."""
+        now = datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc)
+        assert format_relative_time(now - timedelta(minutes=5), now=now) == "5 min ago"
+        assert format_relative_time(now - timedelta(days=1), now=now) == "Yesterday"
+
     def test_naive_datetime_handled(self):
         """Test that naive datetime is handled correctly."""
         naive_dt = datetime.now() - timedelta(hours=2)
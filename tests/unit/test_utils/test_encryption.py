@@ -134,6 +134,10 @@ class TestEncryption:
 
             assert decrypted == plaintext
 
+    def test_fernet_instance_is_reused_for_same_key(self, encryption_module):
+        """Verify the derived Fernet instance is cached per encryption key."""
+        assert encryption_module._get_fernet() is encryption_module._get_fernet()
+
     def test_encrypt_long_value(self, encryption_module):
         """Verify encryption works for long values like OAuth tokens."""
         # OAuth tokens can be quite long
@@ -301,6 +301,47 @@ class TestSanitizeHtmlForWebview:
         assert "Email" in result
         assert "Content" in result
 
+    def test_escaped_markup_in_text_stays_escaped(self):
+        """Verify entity-escaped tags in text are not turned into live markup."""
+        html = (
+            "<p>Hi &lt;img src=x onerror=alert(1)&gt;</p>"
+            "&lt;script&gt;alert(1)&lt;/script&gt;"
+        )
+        result = sanitize_html_for_webview(html)
+
+        assert "&lt;img src=x onerror=alert(1)&gt;" in result
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in result
+        assert "<img" not in result
+        assert "<script" not in result
+
+    def test_preserves_comments(self):
+        """Verify HTML comments keep their delimiters."""
+        html = "<!-- tracking note --><p>Content</p>"
+        result = sanitize_html_for_webview(html)
+
+        assert "<!-- tracking note --><p>Content</p>" in result
+
+    def test_html_text_outside_markup_does_not_count_as_document(self):
+        """Verify "<html" in text, attributes or stripped scripts keeps the wrapper."""
+        fragments = [
+            "<pre>&lt;html&gt;</pre>",
+            '<p title="<html>">Title</p>',
+            '<script>document.write("<html>")</script><p>Content</p>',
+        ]
+
+        for html in fragments:
+            result = sanitize_html_for_webview(html)
+            assert result.startswith("<!DOCTYPE html>"), f"Not wrapped: {html}"
+            assert "max-width" in result
+
+    def test_injects_image_css_into_existing_head(self):
+        """Verify full documents get the image CSS appended inside their head."""
+        html = "<html><head><title>Email</title></head><body><p>x</p></body></html>"
+        result = sanitize_html_for_webview(html)
+
+        head = result[result.index("<head>") : result.index("</head>")]
+        assert "<style>img { max-width: 100%; height: auto; }</style>" in head
+
     def test_adds_link_security_attributes(self):
         """Verify links get security attributes in WebView."""
         html = '<a href="https://example.com">External Link</a>'
@@ -327,6 +368,27 @@ class TestSanitizeHtmlForWebview:
         assert "<object" not in result
         assert "<embed" not in result
 
+    def test_oversized_body_is_rendered_as_escaped_text(self, monkeypatch):
+        """Verify bodies over the size limit skip parsing and contain no markup."""
+        monkeypatch.setattr("src.utils.html_sanitizer.MAX_SANITIZE_LENGTH", 50)
+        html = (
+            '<style type="text/css">.hidden { display: none; }</style>'
+            '<p onclick="evil()">Big &amp; bold</p>'
+            '<SCRIPT>alert(1)</SCRIPT ><img src=x onerror=alert(2)>'
+            '<p>After</p><script>unclosed()'
+        )
+        result = sanitize_html_for_webview(html)
+
+        assert "<!DOCTYPE html>" in result
+        assert "Big &amp; bold" in result
+        assert "After" in result
+        assert "<script" not in result.lower()
+        assert "alert(1)" not in result
+        assert "unclosed()" not in result
+        assert "display: none" not in result
+        assert "<img" not in result
+        assert "onclick" not in result
+
 
 class TestHtmlToPlainText:
     """Test suite for html_to_plain_text function."""